@@ -8,25 +8,35 @@ that automatically updates Tibia from GitHub.
 
 import sys
 import os
+import io
+import re
+import collections
+import functools
+import logging
+import shutil
+import tempfile
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import MappingProxyType
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar,
-    QTextEdit, QComboBox, QFrame, QFileDialog, QMessageBox, QDialog, QGroupBox, QGraphicsDropShadowEffect, QListView,
-    QAbstractButton, QLineEdit, QAbstractItemView, QSlider, QScrollBar, QSpinBox, QDoubleSpinBox, QCheckBox, QRadioButton,
-    QProgressDialog
+    QTextEdit, QComboBox, QFrame, QMessageBox, QDialog, QGroupBox, QGraphicsDropShadowEffect, QListView,
+    QAbstractButton, QLineEdit, QAbstractItemView, QSlider, QScrollBar, QSpinBox, QDoubleSpinBox, QCheckBox, QRadioButton
 )
 def shadow(radius=32, color=(0, 0, 0, 160), offset=(0, 12)):
     eff = QGraphicsDropShadowEffect()
     eff.setBlurRadius(radius)
-    from PySide6.QtGui import QColor
     eff.setColor(QColor(*color))
     eff.setOffset(*offset)
     return eff
-from PySide6.QtCore import Qt, QTimer, QThread, Signal, QPropertyAnimation, QEasingCurve, QObject
-from PySide6.QtGui import QPixmap, QFont, QPalette, QColor, QIcon, QBrush, QPainter, QPen, QPainterPath
+from PySide6.QtCore import (
+    Qt, QEvent, QTimer, QThread, QThreadPool, QRunnable, QUrl, Signal, Slot, QPropertyAnimation, QEasingCurve, QObject
+)
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QNetworkInformation
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache, QColor, QIcon, QPainter, QPainterPath, QDesktopServices
 
 try:
     # Prefer packaged path
@@ -34,8 +44,32 @@ try:
 except Exception:
     # Fallback for dev if package path not available
     from launcher_core import LauncherCore
+# Version helpers have no launcher state, so they are imported from their own module
+from tibialauncher.core.version import parse_version
+
+logger = logging.getLogger(__name__)
+
+# Config strings accepted as "on" for boolean remote-config flags
+_TRUTHY = frozenset({"1", "true", "yes", "on", "y", "t"})
+
+
+def _as_bool(val, default=False):
+    """Interpret a remote-config flag that may be a JSON bool or a string like "yes"."""
+    if isinstance(val, bool):
+        return val
+    if isinstance(val, str):
+        return val.strip().lower() in _TRUTHY
+    return default
+
+
+# Running as the PyInstaller-packaged EXE (launcher self-update only applies there)
+IS_FROZEN = bool(getattr(sys, 'frozen', False))
+
+# Strips a tag's "v" prefix for display (same rule as the core's release normalization)
+_LEADING_V_RE = re.compile(r'^[vV](?=\d)')
 
 
+@functools.lru_cache(maxsize=None)
 def resource_path(*parts: str) -> str:
     """Return absolute path to resource (works for PyInstaller bundle and dev).
 
@@ -45,6 +79,58 @@ def resource_path(*parts: str) -> str:
     base = getattr(sys, '_MEIPASS', Path(__file__).resolve().parent)
     return str(Path(base, *parts))
 
+
+@functools.lru_cache(maxsize=None)
+def resource_exists(*parts: str):
+    """Return ``(path, exists)`` for a bundled resource, stat-ing it only once per process."""
+    path = resource_path(*parts)
+    return path, os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=1)
+def app_icon():
+    """Application icon, built once (call after QApplication exists); None if missing."""
+    icon_path, icon_ok = resource_exists('images', 'logo-universal.png')
+    return QIcon(icon_path) if icon_ok else None
+
+
+def cached_pixmap(key: str, factory) -> QPixmap:
+    """Return the pixmap stored under ``key`` in QPixmapCache, building it on a miss.
+
+    ``factory`` is only called when the cache holds no valid entry, so PNG
+    decoding and smooth scaling are paid once per key rather than per call.
+    """
+    pix = QPixmapCache.find(key)
+    if pix is None or pix.isNull():
+        pix = factory()
+        if not pix.isNull():
+            QPixmapCache.insert(key, pix)
+    return pix
+
+
+def load_blit_pixmap(path: str) -> QPixmap:
+    """Load an image as a pixmap in a format the raster engine can blit without conversion.
+
+    Opaque art becomes RGB32 (plain copy onto the window's ARGB32 premultiplied backing
+    store); art with alpha becomes ARGB32_Premultiplied instead of straight ARGB32,
+    which would otherwise be re-premultiplied on every draw.
+    """
+    img = QImage(path)
+    if img.isNull():
+        return QPixmap()
+    fmt = QImage.Format_ARGB32_Premultiplied if img.hasAlphaChannel() else QImage.Format_RGB32
+    if img.format() != fmt:
+        img = img.convertToFormat(fmt)
+    return QPixmap.fromImage(img)
+
+
+def scaled_pixmap(path: str, w: int, h: int) -> QPixmap:
+    """Return the image at ``path`` scaled to fit w x h, decoded and scaled once per size."""
+    return cached_pixmap(
+        f"{path}:{w}x{h}",
+        lambda: QPixmap(path).scaled(w, h, Qt.KeepAspectRatio, Qt.SmoothTransformation),
+    )
+
 class CenteredComboBox(QComboBox):
     """QComboBox with centered display & popup text.
 
@@ -71,38 +157,72 @@ class DragContainer(QWidget):
     """Central container that lets user drag the frameless window from anywhere
     that is not an interactive control (buttons, inputs, lists, etc.)."""
 
+    # Window base color, shown only if the background artwork is missing
+    BASE_COLOR = QColor('#0e1116')
+
     def __init__(self, window: QMainWindow):
         super().__init__(parent=window)
         self._window = window
         self._dragging = False
         self._drag_offset = None
-        # Preload background artwork for full-frame paint
+        # paintEvent covers every pixel itself, so skip Qt's background erase
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        # Preload background artwork for full-frame paint (shared via QPixmapCache)
+        self._bg_path = None
+        self._bg_pix = None
+        self._bg_scaled = None
+        self._clip_path = None
         try:
-            bg_path = resource_path('images', 'background-artwork.png')
-            self._bg_pix = QPixmap(bg_path) if os.path.exists(bg_path) else None
-            self._bg_scaled = None
+            bg_path, bg_ok = resource_exists('images', 'background-artwork.png')
+            if bg_ok:
+                self._bg_path = bg_path
+                self._bg_pix = cached_pixmap(f"bg:{bg_path}", lambda: load_blit_pixmap(bg_path))
         except Exception:
             self._bg_pix = None
-            self._bg_scaled = None
+        # Coalesce resize bursts: cheap preview immediately, smooth rescale once settled
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._rescale_bg_hi)
 
-    def _is_interactive(self, w: QWidget) -> bool:
-        return isinstance(
-            w,
-            (
-                QAbstractButton,
-                QComboBox,
-                QLineEdit,
-                QTextEdit,
-                QAbstractItemView,
-                QSlider,
-                QScrollBar,
-                QSpinBox,
-                QDoubleSpinBox,
-                QCheckBox,
-                QRadioButton,
-                QProgressBar,
-            ),
+    def _bg_cache_key(self, size) -> str:
+        return f"bgS:{self._bg_path}:{size.width()}x{size.height()}"
+
+    def _rescale_bg_hi(self):
+        """Smooth-scale the background for the current (settled) size and repaint."""
+        if not self._bg_pix or self._bg_pix.isNull():
+            return
+        size = self.size()
+        self._bg_scaled = cached_pixmap(
+            self._bg_cache_key(size),
+            lambda: self._bg_pix.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation),
         )
+        self.update()
+
+    # Widget types that handle the mouse themselves and must never start a window drag
+    _INTERACTIVE_TYPES = frozenset({
+        QAbstractButton,
+        QComboBox,
+        QLineEdit,
+        QTextEdit,
+        QAbstractItemView,
+        QSlider,
+        QScrollBar,
+        QSpinBox,
+        QDoubleSpinBox,
+        QCheckBox,
+        QRadioButton,
+        QProgressBar,
+    })
+    # Classification per concrete widget class (MRO walked once per class)
+    _interactive_cache: dict = {}
+
+    def _is_interactive(self, w: QWidget) -> bool:
+        cls = type(w)
+        result = self._interactive_cache.get(cls)
+        if result is None:
+            result = any(base in self._INTERACTIVE_TYPES for base in cls.__mro__)
+            self._interactive_cache[cls] = result
+        return result
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
@@ -130,86 +250,53 @@ class DragContainer(QWidget):
         self._drag_offset = None
         super().mouseReleaseEvent(event)
 
+    def _rebuild_clip_path(self):
+        # Rounded clip (match root corner radius); only changes with the widget size
+        self._clip_path = QPainterPath()
+        self._clip_path.addRoundedRect(self.rect().adjusted(0, 0, -1, -1), 16, 16)
+
     def resizeEvent(self, event):
+        self._rebuild_clip_path()
         # Keep a scaled version of the background matching current size
         if getattr(self, '_bg_pix', None) and not self._bg_pix.isNull():
-            self._bg_scaled = self._bg_pix.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+            size = self.size()
+            cached = QPixmapCache.find(self._bg_cache_key(size))
+            if cached is not None and not cached.isNull():
+                self._bg_scaled = cached
+            elif self._bg_scaled is None:
+                # First layout: no previous frame to preview with, scale properly now
+                self._rescale_bg_hi()
+            else:
+                # Mid-resize: fast preview now, smooth scale after the burst ends
+                self._bg_scaled = self._bg_pix.scaled(size, Qt.KeepAspectRatioByExpanding, Qt.FastTransformation)
+                self._resize_timer.start(50)
         super().resizeEvent(event)
 
     def paintEvent(self, event):
-        # Paint a scaled background image clipped to rounded corners to fully fill the frame
-        if getattr(self, '_bg_scaled', None) and not self._bg_scaled.isNull():
-            try:
-                painter = QPainter(self)
-                painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
-                # Clip to rounded rect (match stylesheet corner radius)
-                path = QPainterPath()
-                rect = self.rect()
-                path.addRoundedRect(rect.adjusted(0, 0, -1, -1), 16, 16)
-                painter.setClipPath(path)
-                # Center the expanded pixmap
-                x = (rect.width() - self._bg_scaled.width()) // 2
-                y = (rect.height() - self._bg_scaled.height()) // 2
-                painter.drawPixmap(x, y, self._bg_scaled)
-                painter.end()
-            except Exception:
-                pass
+        # Sole painter of the window background (WA_OpaquePaintEvent: no QSS/auto-fill pass
+        # underneath). Paint the scaled image clipped to rounded corners to fill the frame.
+        try:
+            painter = QPainter(self)
+            painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
+            if self._clip_path is None:
+                self._rebuild_clip_path()
+            painter.setClipPath(self._clip_path)
+            rect = self.rect()
+            scaled = self._bg_scaled
+            if scaled is None or scaled.isNull():
+                painter.fillRect(rect, self.BASE_COLOR)
+            else:
+                # Center the expanded pixmap (KeepAspectRatioByExpanding always covers the rect)
+                x = (rect.width() - scaled.width()) // 2
+                y = (rect.height() - scaled.height()) // 2
+                painter.drawPixmap(x, y, scaled)
+            painter.end()
+        except Exception:
+            pass
         # Continue normal painting (children/widgets)
         super().paintEvent(event)
 
 
-class VisualOverlay(QWidget):
-    """Futuristic animated overlay: subtle scanlines + moving glow sweep.
-
-    Transparent to mouse events; paints lightweight effects for a high-tech feel.
-    """
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        self.setAttribute(Qt.WA_TranslucentBackground, True)
-        self.phase = 0
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self._tick)
-        self.timer.start(60)  # ~16 FPS would be 60ms for subtle motion
-
-    def _tick(self):
-        self.phase = (self.phase + 1) % 12
-        self.update()
-
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
-        # Clip to rounded content area (match root radius and margins)
-        path = QPainterPath()
-        clip_rect = self.rect().adjusted(12, 12, -12, -12)
-        path.addRoundedRect(clip_rect, 16, 16)
-        painter.setClipPath(path)
-
-        w = self.width()
-        h = self.height()
-
-        # 1) Horizontal scanlines (very subtle)
-        line_color = QColor(0, 234, 255, 22)
-        pen = QPen(line_color)
-        pen.setWidth(1)
-        painter.setPen(pen)
-        spacing = 6
-        offset = self.phase % spacing
-        y = offset
-        while y < h:
-            painter.drawLine(0, y, w, y)
-            y += spacing
-
-        # 2) Diagonal light sweep (soft translucent band)
-        sweep_color = QColor(255, 0, 204, 18)
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(sweep_color)
-        band_width = int(w * 0.2)
-        x = (self.phase * 12) % (w + band_width) - band_width
-        painter.drawRect(x, 0, band_width, h)
-        painter.end()
-
-
 class TitleBar(QFrame):
     """Custom frameless window title bar with drag support and window controls."""
     def __init__(self, window: QMainWindow):
@@ -226,9 +313,9 @@ class TitleBar(QFrame):
         # Icon + title
         self.icon_label = QLabel()
         self.icon_label.setFixedSize(22, 22)
-        icon_path = resource_path('images', 'logo-universal.png')
-        if os.path.exists(icon_path):
-            self.icon_label.setPixmap(QPixmap(icon_path).scaled(22, 22, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        icon_path, icon_ok = resource_exists('images', 'logo-universal.png')
+        if icon_ok:
+            self.icon_label.setPixmap(scaled_pixmap(icon_path, 22, 22))
         h.addWidget(self.icon_label)
 
         self.title_label = QLabel("Tibia Launcher")
@@ -272,100 +359,379 @@ class TitleBar(QFrame):
         super().mouseReleaseEvent(event)
 
 
-class DownloadThread(QThread):
-    """Thread for handling downloads without blocking UI"""
+class DownloadWorker(QObject):
+    """Runs game update jobs on one long-lived QThread without blocking UI.
+
+    Jobs arrive through ``run_job`` (queued onto the worker thread), so repeat
+    downloads reuse the same thread instead of starting a new one each time.
+    """
+    run_job = Signal(str, object)  # job type, payload
     progress_updated = Signal(float)
     status_updated = Signal(str)
     download_completed = Signal(bool)
     
-    def __init__(self, launcher_core, download_type="update", minimap_type=None):
+    def __init__(self, launcher_core):
         super().__init__()
         self.launcher_core = launcher_core
-        self.download_type = download_type
-        self.minimap_type = minimap_type
+        self.run_job.connect(self._run_job)
     
-    def run(self):
-        """Run the download in background thread"""
+    @Slot(str, object)
+    def _run_job(self, job_type, payload):
+        """Run one job on the worker thread"""
         try:
-            if self.download_type == "update":
-                # Progress callback for updates
+            if job_type == "update":
+                self._last_pct = -1.0
+                self._last_t = 0.0
+                
+                # Progress callback for updates; called per chunk, so only emit on a
+                # visible change (>= 0.5%), every 30 ms, or at completion
                 def progress_callback(downloaded, total):
                     if total > 0:
                         progress = (downloaded / total) * 100
-                        print(f"Download progress: {downloaded}/{total} = {progress:.1f}%")  # Debug print
-                        self.progress_updated.emit(progress)
-                        self.status_updated.emit(f"⬇️ Downloading: {progress:.1f}%")
+                        now = time.monotonic()
+                        if (progress - self._last_pct >= 0.5 or now - self._last_t >= 0.03
+                                or downloaded >= total):
+                            self._last_pct = progress
+                            self._last_t = now
+                            self.progress_updated.emit(progress)
+                            self.status_updated.emit(f"⬇️ Downloading: {progress:.1f}%")
                 
                 success = self.launcher_core.download_and_install(progress_callback)
                 self.download_completed.emit(success)
-                
-            elif self.download_type == "minimap":
-                # Minimap download logic here
-                import requests
-                import zipfile
-                import shutil
-                import tempfile
-                
-                minimap_urls = {
-                    'with-markers': 'https://tibiamaps.io/downloads/minimap-with-markers',
-                    'without-markers': 'https://tibiamaps.io/downloads/minimap-without-markers', 
-                    'with-grid-overlay-and-poi-markers': 'https://tibiamaps.io/downloads/minimap-with-grid-overlay-and-poi-markers'
-                }
-                
-                if self.minimap_type not in minimap_urls:
-                    self.download_completed.emit(False)
-                    return
-                
-                self.status_updated.emit(f"🗺️ Downloading {self.minimap_type} minimap...")
-                
-                # Download the minimap
-                url = minimap_urls[self.minimap_type]
-                response = requests.get(url, stream=True)
-                response.raise_for_status()
-                
-                # Create temp file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.zip') as tmp_file:
-                    total_size = int(response.headers.get('content-length', 0))
-                    downloaded = 0
-                    
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            tmp_file.write(chunk)
-                            downloaded += len(chunk)
-                            if total_size > 0:
-                                progress = (downloaded / total_size) * 100
-                                self.progress_updated.emit(progress)
-                                self.status_updated.emit(f"🗺️ Downloading: {progress:.1f}%")
-                    
-                    temp_file_path = tmp_file.name
-                
-                # Extract and replace minimap folder
-                minimap_dir = os.path.join(self.launcher_core.tibia_dir, "Tibia", "minimap")
-                
-                # Backup existing minimap if it exists
-                if os.path.exists(minimap_dir):
-                    backup_dir = f"{minimap_dir}_backup_{int(time.time())}"
-                    shutil.move(minimap_dir, backup_dir)
-                
-                # Extract new minimap
-                self.status_updated.emit("📂 Extracting minimap...")
-                
-                with zipfile.ZipFile(temp_file_path, 'r') as zip_ref:
-                    zip_ref.extractall(os.path.join(self.launcher_core.tibia_dir, "Tibia"))
-                
-                # Clean up temp file
-                os.unlink(temp_file_path)
-                
-                self.download_completed.emit(True)
+            else:
+                raise ValueError(f"Unknown download job: {job_type}")
                 
         except Exception as e:
             self.status_updated.emit(f"❌ Download failed: {str(e)}")
             self.download_completed.emit(False)
 
 
+class _UpdateCheckTask(QRunnable):
+    """One game-update check on the global QThreadPool (auto-deleted when done)."""
+
+    def __init__(self, launcher, silent):
+        super().__init__()
+        self.setAutoDelete(True)
+        self._launcher = launcher
+        self._silent = silent
+
+    def run(self):
+        self._launcher._run_update_check(self._silent)
+
+
+class MinimapDownloadJob(QObject):
+    """Download and install a minimap archive via QNetworkAccessManager.
+
+    The transfer runs on Qt's own network stack (no Python thread blocks while
+    bytes arrive) and progress comes from native downloadProgress signals;
+    only the extraction step is handed to a QThreadPool worker.
+    """
+    progress_updated = Signal(float)
+    status_updated = Signal(str)
+    download_completed = Signal(bool)
+    # Emitted from the extraction worker, delivered queued on the GUI thread
+    _extraction_finished = Signal(bool, str)
+    
+    MINIMAP_URLS = {
+        'with-markers': 'https://tibiamaps.io/downloads/minimap-with-markers',
+        'without-markers': 'https://tibiamaps.io/downloads/minimap-without-markers',
+        'with-grid-overlay-and-poi-markers': 'https://tibiamaps.io/downloads/minimap-with-grid-overlay-and-poi-markers'
+    }
+    # Minimap archives up to this size are buffered in RAM instead of a temp file
+    MINIMAP_IN_MEMORY_LIMIT = 64 * 1024 * 1024
+    
+    def __init__(self, launcher_core, minimap_type, nam=None, parent=None):
+        super().__init__(parent)
+        self.launcher_core = launcher_core
+        self.minimap_type = minimap_type
+        # Prefer the window's shared manager so repeat downloads reuse its pooled connections
+        self._nam = nam or QNetworkAccessManager(self)
+        self._reply = None
+        self._sink = None
+        self._in_memory = False
+        self._temp_file_path = None
+        self._last_emit = 0.0
+        self._extraction_finished.connect(self._on_extraction_finished)
+    
+    def start(self):
+        """Start the download (returns immediately)."""
+        url = self.MINIMAP_URLS.get(self.minimap_type)
+        if not url:
+            self.download_completed.emit(False)
+            return
+        
+        self.status_updated.emit(f"🗺️ Downloading {self.minimap_type} minimap...")
+        self._reply = self._nam.get(QNetworkRequest(QUrl(url)))
+        self._reply.readyRead.connect(self._on_ready_read)
+        self._reply.downloadProgress.connect(self._on_download_progress)
+        self._reply.finished.connect(self._on_finished)
+    
+    def _open_sink(self, reply):
+        total_size = reply.header(QNetworkRequest.ContentLengthHeader) or 0
+        # Archives of known, modest size stay in memory (no temp-file write + re-read);
+        # unknown or large ones still go through a temp file
+        self._in_memory = 0 < int(total_size) <= self.MINIMAP_IN_MEMORY_LIMIT
+        if self._in_memory:
+            self._sink = io.BytesIO()
+        else:
+            self._sink = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
+            self._temp_file_path = self._sink.name
+    
+    def _on_ready_read(self):
+        if self._sink is None:
+            self._open_sink(self._reply)
+        self._sink.write(self._reply.readAll().data())
+    
+    def _on_download_progress(self, received, total):
+        # Progress capped at ~20 Hz keeps the UI event queue quiet
+        now = time.monotonic()
+        if total > 0 and (now - self._last_emit > 0.05 or received >= total):
+            self._last_emit = now
+            progress = (received / total) * 100
+            self.progress_updated.emit(progress)
+            self.status_updated.emit(f"🗺️ Downloading: {progress:.1f}%")
+    
+    def _on_finished(self):
+        reply = self._reply
+        self._reply = None
+        try:
+            if reply.error() != QNetworkReply.NoError:
+                raise Exception(reply.errorString())
+            if self._sink is None:
+                self._open_sink(reply)
+            self._sink.write(reply.readAll().data())
+            zip_source = self._sink.getvalue() if self._in_memory else self._temp_file_path
+            self._sink.close()
+        except Exception as e:
+            self._cleanup()
+            self.status_updated.emit(f"❌ Download failed: {str(e)}")
+            self.download_completed.emit(False)
+            return
+        finally:
+            reply.deleteLater()
+        
+        # Extract and replace minimap folder
+        self.status_updated.emit("📂 Extracting minimap...")
+        QThreadPool.globalInstance().start(lambda: self._extract(zip_source))
+    
+    def _extract(self, zip_source):
+        """Runs on a QThreadPool worker: back up the old minimap and extract the new one."""
+        
+        try:
+            tibia_target = os.path.join(self.launcher_core.tibia_dir, "Tibia")
+            minimap_dir = os.path.join(tibia_target, "minimap")
+            
+            # Backup existing minimap if it exists
+            if os.path.exists(minimap_dir):
+                backup_dir = f"{minimap_dir}_backup_{int(time.time())}"
+                shutil.move(minimap_dir, backup_dir)
+            
+            last_extract_emit = 0.0
+            
+            def extract_progress(done, total):
+                nonlocal last_extract_emit
+                now = time.monotonic()
+                if total > 0 and (now - last_extract_emit > 0.05 or done >= total):
+                    last_extract_emit = now
+                    self.progress_updated.emit((done / total) * 100)
+            
+            # Minimaps are thousands of small tiles: extract them across a worker pool
+            self.launcher_core.file_manager.extract_zip_parallel(
+                zip_source,
+                tibia_target,
+                progress_callback=extract_progress,
+            )
+            self._extraction_finished.emit(True, "")
+        except Exception as e:
+            self._extraction_finished.emit(False, str(e))
+    
+    def _on_extraction_finished(self, success, error):
+        self._cleanup()
+        if not success:
+            self.status_updated.emit(f"❌ Download failed: {error}")
+        self.download_completed.emit(success)
+    
+    def _cleanup(self):
+        # Clean up temp file (in-memory archives have none)
+        if self._sink is not None and not self._sink.closed:
+            self._sink.close()
+        if self._temp_file_path and os.path.exists(self._temp_file_path):
+            os.unlink(self._temp_file_path)
+        self._temp_file_path = None
+        self._sink = None
+
+
+# Application stylesheet; {ARROW_PATH} is filled in by _render_style().
+# The window_root background is painted by DragContainer, not the stylesheet.
+_STYLE_TEMPLATE = """
+QMainWindow {
+    background-color: transparent;
+    color: #e9f3fb;
+    font-family: Segoe UI, Inter, Arial;
+}
+QWidget#window_root {
+    border-radius: 16px;
+}
+QFrame#title_bar {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #0b1219, stop:1 #101a23);
+    border: 1px solid rgba(0,234,255,40);
+    border-radius: 12px;
+}
+QLabel#window_title {
+    color: #b7dffa;
+    font-weight: 700;
+    letter-spacing: 0.5px;
+}
+QPushButton#win_btn, QPushButton#win_btn_close {
+    background: #0f1720;
+    color: #d6f7ff;
+    border: 1px solid rgba(0,234,255,60);
+    border-radius: 6px;
+}
+QPushButton#win_btn:hover { background: #122333; }
+QPushButton#win_btn_close:hover { background: #2b1a22; border-color: #ff4d4d; color: #fff; }
+QFrame#card {
+    background: rgba(18,20,27,180);
+    border-radius: 22px;
+    border: 1px solid rgba(0,234,255,40);
+}
+QPushButton#config_btn {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #334155, stop:1 #3b485d);
+    color: #e6eef6;
+    border: 1px solid #475569;
+    border-radius: 10px;
+    padding: 8px 18px;
+    font-weight: 600;
+}
+QPushButton#config_btn:hover { border-color: #00eaff; color: #ffffff; }
+QPushButton#config_btn:pressed { background: #2a3444; }
+QPushButton#download_minimap_btn {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #00eaff, stop:1 #4af3ff);
+    color: #0b1014;
+    border: 1px solid rgba(0,234,255,120);
+    border-radius: 12px;
+    padding: 10px 22px;
+    font-weight: 700;
+    letter-spacing: 0.5px;
+}
+QPushButton#download_minimap_btn:hover { border-color: #7ff7ff; }
+QPushButton#download_minimap_btn:pressed { background: #00cfe6; }
+QPushButton#download_minimap_btn:disabled { background: #3a3f44; border-color: #3a3f44; color: #7f868c; }
+QPushButton#play_btn {
+    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #00eaff, stop:1 #09ffc9);
+    color: #061017;
+    border: 1px solid rgba(9,255,201,140);
+    border-radius: 16px;
+    padding: 14px 32px;
+    font-weight: 900;
+    font-size: 32px;
+    letter-spacing: 1.2px;
+}
+QPushButton#play_btn:hover { background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #28fff1, stop:1 #4dffd7); }
+QPushButton#play_btn:pressed { padding-top: 15px; padding-bottom: 13px; }
+QComboBox#minimap_combo {
+    background: #0f1722;
+    color: #d7f9ff;
+    border: 1px solid rgba(0,234,255,60);
+    padding: 6px 32px 6px 16px;
+    border-radius: 10px;
+    min-width: 190px;
+    text-align: center;
+}
+QComboBox#minimap_combo:hover { border-color: rgba(0,234,255,120); }
+QComboBox#minimap_combo::drop-down { width: 24px; border: none; }
+QComboBox#minimap_combo::down-arrow {
+    image: url({ARROW_PATH});
+    subcontrol-origin: padding;
+    subcontrol-position: center right;
+    width: 14px;
+    height: 10px;
+    margin-right: 8px;
+}
+QComboBox#minimap_combo QAbstractItemView {
+    background: #0b1016;
+    color: #dbfaff;
+    selection-background-color: #133f55;
+    selection-color: #eaffff;
+    border: 1px solid #123344;
+    outline: 0;
+}
+QLabel#status {
+    color: #39ffb0;
+    font-weight: 700;
+    font-size: 14px;
+}
+QLabel#muted { color: #a5b4c0; }
+QProgressBar#progress_bar {
+    height: 28px;
+    border: 1px solid rgba(0,234,255,80);
+    border-radius: 14px;
+    background: rgba(8,12,16,180);
+    text-align: center;
+    font-weight: 700;
+    font-size: 13px;
+}
+QProgressBar#progress_bar::chunk {
+    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #00eaff, stop:1 #7df9ff);
+    border-radius: 13px;
+}
+QTextEdit#log_text {
+    background: #0b0f14;
+    color: #63ffa1;
+    font-family: 'Consolas', monospace;
+    font-size: 10px;
+    border: 1px solid #0e1b26;
+    border-radius: 8px;
+}
+
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _render_style(arrow_path: str) -> str:
+    """Return the stylesheet with resource paths injected (rendered once per process)."""
+    return _STYLE_TEMPLATE.replace('{ARROW_PATH}', arrow_path)
+
+
 class PySide6GamingLauncher(QMainWindow):
     # Signal for update notification
     update_available_signal = Signal(str, str)  # current_version, latest_version
+    # Worker -> UI thread (queued): log line, start install
+    log_signal = Signal(str)
+    install_signal = Signal()
+    # Worker -> UI thread: (status text, log line or "") for one update-check state
+    state_signal = Signal(str, str)
+    # Worker -> UI thread: result (status dict, None or exception) of a manual launcher-update check
+    launcher_status_signal = Signal(object)
+    # Download thread -> UI thread: (future, url, sha256, prefetched) of a launcher-update download
+    launcher_download_signal = Signal(object, str, object, bool)
+    # Result of a launcher-update download job when the running EXE already matches the release
+    _LAUNCHER_UP_TO_DATE = object()
+
+    # Update-check state -> (status text, log line); see _emit_state
+    _UPDATE_STATES = MappingProxyType({
+        "checking": ("🔍 Checking for updates...", "🔍 Checking for Tibia game updates..."),
+        "available": ("🔄 Update available!", "🎉 New Tibia update available for download!"),
+        "uptodate": ("✅ Up to date", "✅ You have the latest Tibia version!"),
+        "incomplete": ("⚠️ Version check incomplete",
+                       "⚠️ Could not determine latest version, but release info was fetched."),
+        "failed": ("❌ Update check failed", "❌ Failed to check for updates (no release info)"),
+        "error": ("⚠️ Update check error", "⚠️ Error checking updates: {error}"),
+    })
+    # Any thread -> UI thread: arm the coalescing flush timer
+    _ui_flush_requested = Signal()
+
+    # Event-driven silent checks (network back online / launcher focused) run at most this often
+    UPDATE_CHECK_MIN_INTERVAL = 3600
+    # Fallback timer for sessions that never see either event
+    UPDATE_CHECK_FALLBACK_MS = 12 * 60 * 60 * 1000
+
+    # Minimap combo label -> archive type (central so label changes only happen here)
+    _MINIMAP_MAPPING = MappingProxyType({
+        "With Markers": "with-markers",
+        "Without Markers": "without-markers",
+        "With Grid & POI": "with-grid-overlay-and-poi-markers",
+    })
     
     def __init__(self):
         super().__init__()
@@ -376,8 +742,38 @@ class PySide6GamingLauncher(QMainWindow):
         # Rounded corners / translucent background
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         
+        # Status / progress / log writes are coalesced: latest value wins, applied at ~30 Hz
+        self._pending_status = None
+        self._pending_progress = None
+        self._pending_logs = collections.deque(maxlen=500)
+        self._ui_flush_scheduled = False
+        self._ui_flush_timer = QTimer(self)
+        self._ui_flush_timer.setSingleShot(True)
+        self._ui_flush_timer.setInterval(33)
+        self._ui_flush_timer.timeout.connect(self._flush_ui_updates)
+        self._ui_flush_requested.connect(self._ui_flush_timer.start)
+        
         # Initialize launcher core
         self.launcher_core = LauncherCore()
+        # One network manager for the window: keeps connections and TLS sessions alive across downloads
+        self.nam = QNetworkAccessManager(self)
+        # Persistent download worker + thread, created on first download
+        self._download_worker = None
+        self._download_thread = None
+        self._download_active = False
+        self._last_update_check = 0.0
+        self._network_info = None
+        # Config dialog is built on first open and reused afterwards
+        self._config_dialog = None
+        self._current_dir_label = None
+        self._check_launcher_btn = None
+        # Held while a game / launcher update check runs so overlapping triggers are dropped
+        self._update_check_lock = threading.Lock()
+        self._launcher_check_lock = threading.Lock()
+        # (url, Future, progress relay) for a launcher update downloading while the user decides
+        self._launcher_prefetch = None
+        self._launcher_last_pct = -1
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
         # Launcher version (used for self-update checks and UI)
         try:
             self.LAUNCHER_VERSION = self.launcher_core.get_current_launcher_version()
@@ -406,7 +802,17 @@ class PySide6GamingLauncher(QMainWindow):
                 self.log_message(f"⚠️ Failed to set default install directory: {e}")
         # Connect update signal
         self.update_available_signal.connect(self.show_update_prompt)
+        self.log_signal.connect(self.log_message)
+        self.install_signal.connect(self.download_and_install)
+        self.state_signal.connect(self._apply_state)
+        self.launcher_status_signal.connect(self._on_manual_launcher_status)
+        self.launcher_download_signal.connect(self._on_launcher_download_finished)
         
+        # Show the last known release right away; the check below refreshes it
+        cached_release = self.launcher_core.cached_release_info or {}
+        if cached_release.get('version'):
+            self.log_message(f"🌐 Latest version (last check): {cached_release['version']}")
+
         # Initialize with automatic update check (after potential directory change)
         QTimer.singleShot(2000, lambda: self.check_for_updates(silent=False))  # Check after 2 seconds
 
@@ -414,21 +820,20 @@ class PySide6GamingLauncher(QMainWindow):
         self.setup_animations()
         # Neon glow animation removed per request (static shadow only)
 
-        # Check for launcher updates in background (non-blocking)
-        threading.Thread(target=self.check_launcher_update, daemon=True).start()
+        # Check for launcher updates in background (non-blocking); packaged builds only
+        if IS_FROZEN:
+            threading.Thread(target=self.check_launcher_update, daemon=True).start()
+        else:
+            self.log_message("ℹ️ Skipping launcher self-update in dev mode (not a packaged EXE).")
 
-        # Set up periodic automatic update checking (every 2 hours)
+        # Set up event-driven automatic update checking
         self.setup_periodic_update_check()
-
-        # Launcher updates now use main window progress bar (no separate dialog needed)
     
     def setup_ui(self):
         """Set up the main user interface in Lionot card style"""
         central_widget = DragContainer(self)
         central_widget.setObjectName("window_root")
-        # Ensure stylesheet background (image/color) is painted on translucent window
-        central_widget.setAttribute(Qt.WA_StyledBackground, True)
-        central_widget.setAutoFillBackground(True)
+        # Background (artwork + base color) is painted by DragContainer.paintEvent
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(24, 24, 24, 24)
@@ -530,150 +935,24 @@ class PySide6GamingLauncher(QMainWindow):
     def apply_styles(self):
         """Apply a high-tech Qt Style Sheet for a modern neon look.
 
-        Inject absolute path to background so it resolves inside PyInstaller bundle.
+        Inject the absolute path to the combo arrow so it resolves inside the
+        PyInstaller bundle. The background artwork is painted by DragContainer.
         """
-        bg_path = resource_path('images', 'background-artwork.png').replace('\\', '/')
-        style = """
-QMainWindow {
-    background-color: transparent;
-    color: #e9f3fb;
-    font-family: Segoe UI, Inter, Arial;
-}
-QWidget#window_root {
-    background-color: #0e1116;
-    background-image: url({BG_PATH});
-    background-position: center center;
-    background-repeat: no-repeat;
-    border-radius: 16px;
-}
-QFrame#title_bar {
-    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #0b1219, stop:1 #101a23);
-    border: 1px solid rgba(0,234,255,40);
-    border-radius: 12px;
-}
-QLabel#window_title {
-    color: #b7dffa;
-    font-weight: 700;
-    letter-spacing: 0.5px;
-}
-QPushButton#win_btn, QPushButton#win_btn_close {
-    background: #0f1720;
-    color: #d6f7ff;
-    border: 1px solid rgba(0,234,255,60);
-    border-radius: 6px;
-}
-QPushButton#win_btn:hover { background: #122333; }
-QPushButton#win_btn_close:hover { background: #2b1a22; border-color: #ff4d4d; color: #fff; }
-QFrame#card {
-    background: rgba(18,20,27,180);
-    border-radius: 22px;
-    border: 1px solid rgba(0,234,255,40);
-}
-QPushButton#config_btn {
-    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #334155, stop:1 #3b485d);
-    color: #e6eef6;
-    border: 1px solid #475569;
-    border-radius: 10px;
-    padding: 8px 18px;
-    font-weight: 600;
-}
-QPushButton#config_btn:hover { border-color: #00eaff; color: #ffffff; }
-QPushButton#config_btn:pressed { background: #2a3444; }
-QPushButton#download_minimap_btn {
-    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #00eaff, stop:1 #4af3ff);
-    color: #0b1014;
-    border: 1px solid rgba(0,234,255,120);
-    border-radius: 12px;
-    padding: 10px 22px;
-    font-weight: 700;
-    letter-spacing: 0.5px;
-}
-QPushButton#download_minimap_btn:hover { border-color: #7ff7ff; }
-QPushButton#download_minimap_btn:pressed { background: #00cfe6; }
-QPushButton#download_minimap_btn:disabled { background: #3a3f44; border-color: #3a3f44; color: #7f868c; }
-QPushButton#play_btn {
-    background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #00eaff, stop:1 #09ffc9);
-    color: #061017;
-    border: 1px solid rgba(9,255,201,140);
-    border-radius: 16px;
-    padding: 14px 32px;
-    font-weight: 900;
-    font-size: 32px;
-    letter-spacing: 1.2px;
-}
-QPushButton#play_btn:hover { background: qlineargradient(x1:0,y1:0,x2:0,y2:1, stop:0 #28fff1, stop:1 #4dffd7); }
-QPushButton#play_btn:pressed { padding-top: 15px; padding-bottom: 13px; }
-QComboBox#minimap_combo {
-    background: #0f1722;
-    color: #d7f9ff;
-    border: 1px solid rgba(0,234,255,60);
-    padding: 6px 32px 6px 16px;
-    border-radius: 10px;
-    min-width: 190px;
-    text-align: center;
-}
-QComboBox#minimap_combo:hover { border-color: rgba(0,234,255,120); }
-QComboBox#minimap_combo::drop-down { width: 24px; border: none; }
-QComboBox#minimap_combo::down-arrow {
-    image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAA4AAAAKCAYAAABbayygAAAACXBIWXMAAAsTAAALEwEAmpwYAAAAVUlEQVR4nGNgQAP/GBgY/jMwMDCgYGB4x4AFiNXAwPCfAQb+M2BgYHhPAlEM2B8gfgxEHWAAZiAmQMQPxiEgawZkgHEg2BnQAUxvA/E6IYwBxGBoYFQmAABf3Q+0PsL6QgAAAABJRU5ErkJggg==);
-    subcontrol-origin: padding;
-    subcontrol-position: center right;
-    width: 14px;
-    height: 10px;
-    margin-right: 8px;
-}
-QComboBox#minimap_combo QAbstractItemView {
-    background: #0b1016;
-    color: #dbfaff;
-    selection-background-color: #133f55;
-    selection-color: #eaffff;
-    border: 1px solid #123344;
-    outline: 0;
-}
-QLabel#status {
-    color: #39ffb0;
-    font-weight: 700;
-    font-size: 14px;
-}
-QLabel#muted { color: #a5b4c0; }
-QProgressBar#progress_bar {
-    height: 28px;
-    border: 1px solid rgba(0,234,255,80);
-    border-radius: 14px;
-    background: rgba(8,12,16,180);
-    text-align: center;
-    font-weight: 700;
-    font-size: 13px;
-}
-QProgressBar#progress_bar::chunk {
-    background: qlineargradient(x1:0,y1:0,x2:1,y2:0, stop:0 #00eaff, stop:1 #7df9ff);
-    border-radius: 13px;
-}
-QTextEdit#log_text {
-    background: #0b0f14;
-    color: #63ffa1;
-    font-family: 'Consolas', monospace;
-    font-size: 10px;
-    border: 1px solid #0e1b26;
-    border-radius: 8px;
-}
-
-"""
-        style = style.replace('{BG_PATH}', bg_path)
-        self.setStyleSheet(style)
+        # Shipped as a file so Qt loads it through its image cache instead of
+        # base64-decoding an inline data URI on every stylesheet parse
+        arrow_path = resource_path('images', 'combo-arrow.png').replace('\\', '/')
+        self.setStyleSheet(_render_style(arrow_path))
     
     def load_images(self):
         """Load background and logo images with PyInstaller compatibility."""
         try:
             # Background handled via stylesheet now, but keep palette fallback if needed
-            logo_primary = resource_path('images', 'logo-universal.png')
-            logo_fallback = resource_path('images', 'logo-universal.png')
-            logo_path = logo_primary if os.path.exists(logo_primary) else logo_fallback
-            if os.path.exists(logo_path) and hasattr(self, 'logo_label'):
-                logo_pix = QPixmap(logo_path).scaled(240, 120, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            logo_path, logo_ok = resource_exists('images', 'logo-universal.png')
+            if logo_ok and hasattr(self, 'logo_label'):
+                logo_pix = scaled_pixmap(logo_path, 240, 120)
                 self.logo_label.setPixmap(logo_pix)
         except Exception as e:
-            print(f"Image load issue: {e}")
+            logger.warning("Image load issue: %s", e)
     
     def setup_animations(self):
         """Set up fade-in animation"""
@@ -693,29 +972,66 @@ QTextEdit#log_text {
     def resizeEvent(self, event):
         """Handle window resize (no overlay to reposition)."""
         return super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        # Don't keep the startup fade ticking while minimized; just finish it
+        if event.type() == QEvent.WindowStateChange and self.windowState() & Qt.WindowMinimized:
+            fade = getattr(self, 'fade_animation', None)
+            if fade is not None and fade.state() == QPropertyAnimation.Running:
+                fade.stop()
+                self.setWindowOpacity(1.0)
+        super().changeEvent(event)
     
 
 
     def log_message(self, message):
         """Add a message to the activity log"""
-        self.log_text.append(message)
-        # Auto-scroll to bottom
-        scrollbar = self.log_text.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        self._pending_logs.append(message)
+        self._schedule_ui_flush()
     
     def update_status(self, message):
         """Update the status label"""
-        self.status_label.setText(message)
+        self._pending_status = message
+        self._schedule_ui_flush()
     
     def update_progress(self, value):
         """Update the progress bar"""
-        if value > 0:
-            self.progress_bar.setVisible(True)
-            self.progress_bar.setValue(int(value))
-            print(f"Progress updated: {value}%")  # Debug print
-        else:
-            self.progress_bar.setVisible(False)
-            print("Progress hidden")  # Debug print
+        self._pending_progress = value
+        self._schedule_ui_flush()
+
+    def _schedule_ui_flush(self):
+        # Safe from worker threads: the signal is delivered queued to the timer's thread
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self._ui_flush_requested.emit()
+
+    def _flush_ui_updates(self):
+        """Apply the latest pending status / progress and all queued log lines in one pass."""
+        # Reset first so writes arriving during the flush schedule another one
+        self._ui_flush_scheduled = False
+
+        status, self._pending_status = self._pending_status, None
+        if status is not None:
+            self.status_label.setText(status)
+
+        value, self._pending_progress = self._pending_progress, None
+        if value is not None:
+            if value > 0:
+                self.progress_bar.setVisible(True)
+                self.progress_bar.setValue(int(value))
+                logger.debug("Progress updated: %s%%", value)
+            else:
+                self.progress_bar.setVisible(False)
+                logger.debug("Progress hidden")
+
+        lines = []
+        while self._pending_logs:
+            lines.append(self._pending_logs.popleft())
+        if lines:
+            self.log_text.append('\n'.join(lines))
+            # Auto-scroll to bottom
+            scrollbar = self.log_text.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
 
     # (Players online feature removed at user request)
     
@@ -729,33 +1045,26 @@ QTextEdit#log_text {
     
     def download_selected_minimap(self):
         """Download the selected minimap"""
-        selected = self.minimap_combo.currentText()
-
-        # Central mapping so any label change only needs updating here
-        minimap_mapping = {
-            "With Markers": "with-markers",
-            "Without Markers": "without-markers",
-            "With Grid & POI": "with-grid-overlay-and-poi-markers",
-        }
-
-        if selected not in minimap_mapping:
+        minimap_type = self._MINIMAP_MAPPING.get(self.minimap_combo.currentText())
+        if minimap_type is None:
             QMessageBox.warning(self, "Selection Required", "Please select a minimap type first!")
             return
 
-        minimap_type = minimap_mapping[selected]
-
         # Disable button during download
         self.download_minimap_btn.setEnabled(False)
 
-        # Start download thread
-        self.minimap_thread = DownloadThread(self.launcher_core, "minimap", minimap_type)
-        self.minimap_thread.progress_updated.connect(self.update_progress)
-        self.minimap_thread.status_updated.connect(self.update_status)
-        self.minimap_thread.download_completed.connect(self.on_minimap_download_complete)
-        self.minimap_thread.start()
+        # Start download job (runs on Qt's network stack, no dedicated thread)
+        self.minimap_job = MinimapDownloadJob(self.launcher_core, minimap_type, self.nam, self)
+        self.minimap_job.progress_updated.connect(self.update_progress)
+        self.minimap_job.status_updated.connect(self.update_status)
+        self.minimap_job.download_completed.connect(self.on_minimap_download_complete)
+        # A finished job is done with its reply and buffers; don't keep it as a child of the window
+        self.minimap_job.download_completed.connect(self.minimap_job.deleteLater)
+        self.minimap_job.start()
     
     def on_minimap_download_complete(self, success):
         """Handle minimap download completion"""
+        self.minimap_job = None
         if success:
             self.update_status("✅ Minimap installed!")
             self.log_message("✅ Minimap installed successfully!")
@@ -772,96 +1081,141 @@ QTextEdit#log_text {
         
         self.update_progress(0)
     
+    def _download_in_progress(self):
+        return self._download_active
+
     def check_for_updates(self, silent=False):
         """Check for updates automatically on startup"""
-        def check_updates():
-            try:
-                if not silent:
-                    self.update_status("🔍 Checking for updates...")
-                    self.log_message("🔍 Checking for Tibia game updates...")
+        # Skip if a check is already running or an update is being installed
+        if self._download_in_progress() or not self._update_check_lock.acquire(blocking=False):
+            return
+        self._last_update_check = time.monotonic()
+
+        if self.launcher_core.is_metadata_fresh():
+            # Answerable from the core's cache: no network I/O, so no worker needed
+            self._run_update_check(silent)
+            return
+        # Run on the shared pool to avoid blocking UI
+        QThreadPool.globalInstance().start(_UpdateCheckTask(self, silent))
+
+    def _emit_state(self, state, silent, **fmt):
+        """Send one update-check state to the UI as a single (status, log) signal.
+
+        Silent checks only update the status line, except for 'available',
+        which is always logged.
+        """
+        status, log = self._UPDATE_STATES[state]
+        if silent and state != "available":
+            log = ""
+        elif fmt:
+            log = log.format(**fmt)
+        self.state_signal.emit(status, log)
+
+    def _apply_state(self, status, log):
+        self.update_status(status)
+        if log:
+            self.log_message(log)
+
+    def _run_update_check(self, silent):
+        """Update check body; reaches the UI only via signals.
+
+        Runs on a QThreadPool worker, or inline on the GUI thread when the core can
+        answer from cache (the signals then deliver directly).
+        """
+        try:
+            if not silent:
+                self._emit_state("checking", silent)
+
+            current_version = self.launcher_core.get_current_version() or 'Not installed'
+            if not silent:
+                self.log_signal.emit(f"📋 Current version: {current_version}")
+
+            # Optional auto-install behavior from remote config
+            cfg = self.launcher_core.get_remote_config() or {}
+            auto_install = _as_bool(cfg.get('auto_install_updates'))
+
+            latest_info = self.launcher_core.get_latest_release_info()
+            latest_version = ''
+            if not latest_info:
+                state = "failed"
+            else:
+                latest_version = latest_info.get('version') or latest_info.get('tag_name') or latest_info.get('name') or ''
+                latest_version = _LEADING_V_RE.sub('', latest_version)
 
-                current_version = self.launcher_core.get_current_version() or 'Not installed'
                 if not silent:
-                    self.log_message(f"📋 Current version: {current_version}")
-
-                # Optional auto-install behavior from remote config
-                auto_install = False
-                try:
-                    cfg = self.launcher_core.get_remote_config()
-                    val = (cfg or {}).get('auto_install_updates')
-                    if isinstance(val, bool):
-                        auto_install = val
-                    elif isinstance(val, str):
-                        auto_install = val.strip().lower() in ("1", "true", "yes", "on")
-                except Exception:
-                    auto_install = False
-
-                latest_info = self.launcher_core.get_latest_release_info()
-                if latest_info:
-                    latest_version = latest_info.get('version') or latest_info.get('tag_name') or latest_info.get('name') or ''
-                    # Normalize leading v
-                    if latest_version.lower().startswith('v') and latest_version[1:2].isdigit():
-                        latest_version = latest_version[1:]
-
-                    if not silent:
-                        self.log_message(f"🌐 Latest version: {latest_version or 'Unknown'}")
-
-                    # Decide if update is needed
-                    needs_update = False
-                    if latest_version:
-                        if current_version == "Not installed":
-                            needs_update = True
-                        else:
-                            try:
-                                needs_update = self.launcher_core._compare_versions(current_version, latest_version) < 0
-                            except Exception:
-                                needs_update = (current_version != latest_version)
-
-                    if latest_version and needs_update:
-                        # Update available - make it prominent
-                        self.update_status("🔄 Update available!")
-                        self.log_message("🎉 New Tibia update available for download!")
-
-                        # Automatically start download if not installed
-                        if current_version == "Not installed":
-                            self.log_message("📦 Tibia is not installed. Starting automatic download...")
-                            self.download_and_install()
-                        # If installed and auto_install is enabled, start automatically
-                        elif auto_install:
-                            self.log_message("⚙️ Auto-install enabled via config. Starting update...")
-                            self.download_and_install()
-                        # Otherwise, prompt user as before
-                        elif not silent:
-                            self.update_available_signal.emit(current_version, latest_version)
-
-                    elif latest_version:
-                        self.update_status("✅ Up to date")
-                        if not silent:
-                            self.log_message("✅ You have the latest Tibia version!")
-                    else:
-                        self.update_status("⚠️ Version check incomplete")
-                        if not silent:
-                            self.log_message("⚠️ Could not determine latest version, but release info was fetched.")
+                    self.log_signal.emit(f"🌐 Latest version: {latest_version or 'Unknown'}")
+
+                # Decide if update is needed
+                if not latest_version:
+                    state = "incomplete"
+                elif current_version == "Not installed":
+                    state = "available"
+                elif current_version == latest_version:
+                    state = "uptodate"  # common steady state: no parse needed
                 else:
-                    self.update_status("❌ Update check failed")
-                    if not silent:
-                        self.log_message("❌ Failed to check for updates (no release info)")
-            except Exception as e:
-                self.update_status("⚠️ Update check error")
-                if not silent:
-                    self.log_message(f"⚠️ Error checking updates: {str(e)}")
-        # Run in thread to avoid blocking UI
-        thread = threading.Thread(target=check_updates, daemon=True)
-        thread.start()
+                    try:
+                        needs_update = self._parse_version(current_version) < self._parse_version(latest_version)
+                    except Exception:
+                        needs_update = (current_version != latest_version)
+                    state = "available" if needs_update else "uptodate"
+
+            self._emit_state(state, silent)
+
+            if state == "available":
+                # Automatically start download if not installed
+                if current_version == "Not installed":
+                    self.log_signal.emit("📦 Tibia is not installed. Starting automatic download...")
+                    self.install_signal.emit()
+                # If installed and auto_install is enabled, start automatically
+                elif auto_install:
+                    self.log_signal.emit("⚙️ Auto-install enabled via config. Starting update...")
+                    self.install_signal.emit()
+                # Otherwise, prompt user as before
+                elif not silent:
+                    self.update_available_signal.emit(current_version, latest_version)
+        except Exception as e:
+            self._emit_state("error", silent, error=e)
+        finally:
+            self._update_check_lock.release()
     
     def setup_periodic_update_check(self):
-        """Set up automatic periodic update checking"""
-        # Create timer for periodic checks (every 2 hours = 7200000 ms)
-        self.update_check_timer = QTimer()
-        self.update_check_timer.timeout.connect(lambda: self.check_for_updates(silent=True))
-        self.update_check_timer.start(7200000)  # 2 hours
+        """Set up automatic update checking driven by network / focus events"""
+        # Re-check when connectivity returns (no point polling while offline)
+        try:
+            if QNetworkInformation.loadDefaultBackend():
+                self._network_info = QNetworkInformation.instance()
+                self._network_info.reachabilityChanged.connect(self._on_reachability_changed)
+        except Exception:
+            self._network_info = None
+        # ...and when the user comes back to the launcher
+        QApplication.instance().applicationStateChanged.connect(self._on_application_state_changed)
+
+        # Long fallback timer in case neither event fires
+        self.update_check_timer = QTimer(self)
+        self.update_check_timer.timeout.connect(self._maybe_check_for_updates)
+        self.update_check_timer.start(self.UPDATE_CHECK_FALLBACK_MS)
         
-        self.log_message("⏰ Automatic update checking enabled (every 2 hours)")
+        self.log_message("⏰ Automatic update checking enabled (on reconnect / focus, at most hourly)")
+
+    def _is_offline(self):
+        return (self._network_info is not None
+                and self._network_info.reachability() == QNetworkInformation.Reachability.Disconnected)
+
+    def _maybe_check_for_updates(self):
+        """Silent check, skipped while offline or within UPDATE_CHECK_MIN_INTERVAL of the last one."""
+        if self._is_offline():
+            return
+        if time.monotonic() - self._last_update_check < self.UPDATE_CHECK_MIN_INTERVAL:
+            return
+        self.check_for_updates(silent=True)
+
+    def _on_reachability_changed(self, reachability):
+        if reachability == QNetworkInformation.Reachability.Online:
+            self._maybe_check_for_updates()
+
+    def _on_application_state_changed(self, state):
+        if state == Qt.ApplicationActive:
+            self._maybe_check_for_updates()
     
     def show_update_prompt(self, current_version, latest_version):
         """Show update prompt on main thread (connected to signal)"""
@@ -884,21 +1238,21 @@ QTextEdit#log_text {
     
     # ---------------- Launcher self-update ----------------
     def _parse_version(self, v: str):
-        try:
-            return tuple(int(x) for x in (v.strip().lstrip('v').split('.')))
-        except Exception:
-            return (0,)
+        return parse_version(v)
 
     def check_launcher_update(self):
         """Check remote config for a newer launcher EXE and install or prompt accordingly."""
+        # Only applicable for packaged builds
+        if not IS_FROZEN:
+            return
+        if self._download_in_progress() or not self._launcher_check_lock.acquire(blocking=False):
+            return
         try:
-            # Only applicable for packaged builds
-            if not getattr(sys, 'frozen', False):
-                self.log_message("ℹ️ Skipping launcher self-update in dev mode (not a packaged EXE).")
-                return
+            # Fetch the remote config once and share it with the core check
+            cfg = self.launcher_core.get_remote_config() or {}
 
             # Ask core to determine availability and download URL
-            status = self.launcher_core.check_launcher_update()
+            status = self.launcher_core.check_launcher_update(cfg or None)
             if not status or not isinstance(status, dict):
                 return
             if not status.get('available'):
@@ -906,27 +1260,20 @@ QTextEdit#log_text {
 
             latest = status.get('latest_version', '')
             download_url = status.get('download_url')
+            sha256 = status.get('sha256')
             if not download_url:
                 return
 
             # Read auto-install flag from remote config
-            cfg = self.launcher_core.get_remote_config() or {}
-            auto_install = False
-            try:
-                val = cfg.get('auto_install_launcher_updates') or cfg.get('auto_update_launcher')
-                if isinstance(val, bool):
-                    auto_install = val
-                elif isinstance(val, str):
-                    auto_install = val.strip().lower() in ("1", "true", "yes", "on")
-            except Exception:
-                auto_install = False
+            auto_install = _as_bool(cfg.get('auto_install_launcher_updates') or cfg.get('auto_update_launcher'))
 
             if auto_install:
                 self.log_message(f"⚙️ Auto-installing new launcher {latest}...")
-                self.download_and_apply_launcher_update(download_url)
+                self.download_and_apply_launcher_update(download_url, sha256)
                 return
 
-            # Otherwise prompt the user
+            # Otherwise prompt the user, downloading in the meantime
+            self._prefetch_launcher_update(download_url, sha256)
             reply = QMessageBox.question(
                 self,
                 "Update Launcher",
@@ -935,40 +1282,88 @@ QTextEdit#log_text {
                 QMessageBox.Yes
             )
             if reply == QMessageBox.Yes:
-                self.download_and_apply_launcher_update(download_url)
+                self.download_and_apply_launcher_update(download_url, sha256)
         except Exception as e:
             self.log_message(f"⚠️ Launcher update check error: {e}")
+        finally:
+            self._launcher_check_lock.release()
 
-    # Launcher updates now use main window progress bar directly (no separate dialog)
-
-    # Game updates now use main window progress bar directly (no separate dialog)
+    def download_and_apply_launcher_update(self, url: str, sha256: str | None = None):
+        """Download the new EXE and replace the running EXE using a temporary batch.
 
-    def download_and_apply_launcher_update(self, url: str):
-        """Download the new EXE and replace the running EXE using a temporary batch."""
+        ``sha256`` (from the release metadata) lets an identical running EXE skip the
+        update and makes the core verify the download before it is applied.
+        """
+        if not IS_FROZEN:
+            self.log_message("ℹ️ Launcher self-update is only available in packaged EXE.")
+            return
         try:
-            if not getattr(sys, 'frozen', False):
-                self.log_message("ℹ️ Launcher self-update is only available in packaged EXE.")
-                return
-
             # Prepare UI
             self.update_status("🔄 Preparing launcher update...")
             self.update_progress(0)
             self.log_message("🔄 Starting launcher self-update...")
             self.play_btn.setEnabled(False)
 
-            # Progress mapper for UI
-            def progress_cb(percent: float):
-                try:
-                    # Clamp and update main progress bar
-                    pct = max(0, min(int(percent), 100))
-                    self.update_progress(pct)
-                    self.update_status(f"⬇️ Downloading launcher update... {pct}%")
-                except Exception:
-                    pass
-
-            # Download new launcher
-            temp_path = self.launcher_core.download_launcher_update(url, progress_callback=progress_cb)
+            self._launcher_last_pct = -1
+
+            # Pick up the copy fetched while the prompt was open (reporting its progress
+            # from here on), or download now; either way the UI thread never waits on it
+            prefetch, self._launcher_prefetch = self._launcher_prefetch, None
+            prefetched = prefetch is not None and prefetch[0] == url
+            if prefetched:
+                _, future, relay = prefetch
+                relay[0] = self._launcher_download_progress
+                self.update_status("⬇️ Finishing launcher update download...")
+            else:
+                future = self._prefetch_pool.submit(
+                    self._fetch_launcher_update, url, self._launcher_download_progress, sha256)
+            future.add_done_callback(
+                lambda f: self.launcher_download_signal.emit(f, url, sha256, prefetched))
+
+        except Exception as e:
+            self.log_message(f"❌ Launcher self-update failed: {e}")
+            self._restore_launcher_ui()
+
+    def _fetch_launcher_update(self, url: str, progress_callback, sha256: str | None):
+        """Pool job: the downloaded EXE path, or _LAUNCHER_UP_TO_DATE if the running EXE already matches."""
+        # Hashing the onefile EXE reads tens of MB, so it stays off the UI thread too
+        if sha256 and self.launcher_core.file_manager.file_sha256(sys.executable) == sha256:
+            return self._LAUNCHER_UP_TO_DATE
+        return self.launcher_core.download_launcher_update(url, progress_callback, sha256)
+
+    def _launcher_download_progress(self, percent: float):
+        """Progress mapper for UI (any thread); the core reports 0..100 on whole-percent steps"""
+        pct = int(percent)
+        if pct == self._launcher_last_pct:
+            return
+        self._launcher_last_pct = pct
+        try:
+            self.update_progress(pct)
+            self.update_status(f"⬇️ Downloading launcher update... {pct}%")
+        except Exception:
+            pass
+
+    def _on_launcher_download_finished(self, future, url: str, sha256, prefetched: bool):
+        """Apply a finished launcher download (UI thread); a failed prefetch is retried once."""
+        try:
+            try:
+                temp_path = future.result()
+            except Exception:
+                temp_path = None
+            if temp_path is self._LAUNCHER_UP_TO_DATE:
+                self.log_message("✅ Launcher is already up to date (checksum matches).")
+                self.update_status("✅ Launcher is up to date")
+                self._restore_launcher_ui()
+                return
             if not temp_path or not os.path.exists(temp_path):
+                if prefetched:
+                    # The background copy failed: fetch again (resuming any .part) with progress
+                    future = self._prefetch_pool.submit(
+                        self._fetch_launcher_update, url,
+                        self._launcher_download_progress, sha256)
+                    future.add_done_callback(
+                        lambda f: self.launcher_download_signal.emit(f, url, sha256, False))
+                    return
                 raise Exception("Failed to download launcher update")
 
             # Apply update (spawns a batch to copy and restart)
@@ -987,13 +1382,25 @@ QTextEdit#log_text {
             self.log_message(f"❌ Launcher self-update failed: {e}")
             self._restore_launcher_ui()
     
-    def _simulate_launcher_progress(self):
-        """Deprecated: kept for reference but no longer used (real download now)."""
-        try:
-            self.update_status("ℹ️ Simulation disabled; performing real update when packaged.")
-        except Exception:
-            pass
-    
+    def _prefetch_launcher_update(self, url: str, sha256: str | None = None):
+        """Start downloading a launcher update in the background (once per URL).
+
+        download_and_apply_launcher_update picks the result up, so accepting the
+        prompt usually finds the file already on disk. Progress goes to whatever
+        callback it later puts in the relay slot.
+        """
+        if self._launcher_prefetch is not None and self._launcher_prefetch[0] == url:
+            return
+        relay = [None]
+
+        def relay_progress(percent):
+            callback = relay[0]
+            if callback is not None:
+                callback(percent)
+
+        future = self._prefetch_pool.submit(self._fetch_launcher_update, url, relay_progress, sha256)
+        self._launcher_prefetch = (url, future, relay)
+
     def _restore_launcher_ui(self):
         """Restore UI after launcher update completion or failure"""
         try:
@@ -1004,20 +1411,39 @@ QTextEdit#log_text {
     
     def download_and_install(self):
         """Download and install updates (called automatically by update system)"""
+        if self._download_in_progress():
+            return
         
         # Update status and reset progress
         self.update_status("🔄 Preparing download...")
         self.update_progress(0)
         
-        # Start download thread - use main window progress, no separate dialog
-        self.download_thread = DownloadThread(self.launcher_core, "update")
-        self.download_thread.progress_updated.connect(self.update_progress)
-        self.download_thread.status_updated.connect(self.update_status)
-        self.download_thread.download_completed.connect(self.on_download_complete)
-        self.download_thread.start()
+        # Hand the job to the persistent worker - use main window progress, no separate dialog
+        self._download_active = True
+        self._ensure_download_worker().run_job.emit("update", None)
+
+    def _ensure_download_worker(self):
+        """Create the download worker and its thread on first use."""
+        if self._download_worker is None:
+            self._download_thread = QThread(self)
+            self._download_worker = DownloadWorker(self.launcher_core)
+            self._download_worker.moveToThread(self._download_thread)
+            self._download_worker.progress_updated.connect(self.update_progress)
+            self._download_worker.status_updated.connect(self.update_status)
+            self._download_worker.download_completed.connect(self.on_download_complete)
+            self._download_thread.finished.connect(self._download_worker.deleteLater)
+            QApplication.instance().aboutToQuit.connect(self._stop_download_worker)
+            self._download_thread.start()
+        return self._download_worker
+
+    def _stop_download_worker(self):
+        if self._download_thread is not None:
+            self._download_thread.quit()
+            self._download_thread.wait()
     
     def on_download_complete(self, success):
         """Handle download completion"""
+        self._download_active = False
         if success:
             self.update_status("✅ Installation completed!")
             self.log_message("🎉 Installation completed successfully!")
@@ -1042,7 +1468,14 @@ QTextEdit#log_text {
             self.log_message(f"❌ Failed to launch: {str(e)}")
     
     def open_config_dialog(self):
-        """Open configuration dialog"""
+        """Open configuration dialog (built on first use, then reused)"""
+        if self._config_dialog is None:
+            self._config_dialog = self._build_config_dialog()
+        # Only the directory label can change between opens
+        self._current_dir_label.setText(f"Current: {self.launcher_core.tibia_dir}")
+        self._config_dialog.exec()
+
+    def _build_config_dialog(self):
         dialog = QDialog(self)
         dialog.setWindowTitle("⚙️ Launcher Configuration")
         dialog.setModal(True)
@@ -1054,21 +1487,12 @@ QTextEdit#log_text {
         dir_group = QGroupBox("Installation Directory")
         dir_layout = QVBoxLayout(dir_group)
         
-        current_dir_label = QLabel(f"Current: {self.launcher_core.tibia_dir}")
-        current_dir_label.setWordWrap(True)
-        dir_layout.addWidget(current_dir_label)
+        self._current_dir_label = QLabel(f"Current: {self.launcher_core.tibia_dir}")
+        self._current_dir_label.setWordWrap(True)
+        dir_layout.addWidget(self._current_dir_label)
         # Quick access to installation folder
         open_btn = QPushButton("📂 Open Installation Folder")
-        def open_folder():
-            path = self.launcher_core.tibia_dir
-            try:
-                os.makedirs(path, exist_ok=True)
-                from PySide6.QtGui import QDesktopServices
-                from PySide6.QtCore import QUrl
-                QDesktopServices.openUrl(QUrl.fromLocalFile(path))
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to open folder: {e}")
-        open_btn.clicked.connect(open_folder)
+        open_btn.clicked.connect(self._config_open_folder)
         dir_layout.addWidget(open_btn)
 
         fixed_info = QLabel("Installation location is fixed to %APPDATA%/Tibia.")
@@ -1097,50 +1521,12 @@ QTextEdit#log_text {
         update_layout.addWidget(update_info)
 
         check_update_btn = QPushButton("🔄 Check for Tibia Update")
-        def do_manual_update():
-            try:
-                status = self.launcher_core.check_tibia_version_status()
-                cur = status.get('current_version', 'Unknown')
-                latest = status.get('latest_version', 'Unknown')
-                if status.get('update_available'):
-                    reply = QMessageBox.question(
-                        dialog,
-                        "Update Available",
-                        f"A new update is available.\n\nCurrent: {cur}\nLatest: {latest}\n\nDownload and install now?",
-                        QMessageBox.Yes | QMessageBox.No,
-                        QMessageBox.Yes
-                    )
-                    if reply == QMessageBox.Yes:
-                        dialog.accept()
-                        self.download_and_install()
-                else:
-                    QMessageBox.information(dialog, "Up to date", f"No updates available.\nCurrent: {cur}\nLatest: {latest}")
-            except Exception as e:
-                QMessageBox.critical(dialog, "Error", f"Failed to check updates: {e}")
-        check_update_btn.clicked.connect(do_manual_update)
+        check_update_btn.clicked.connect(self._config_manual_update)
         update_layout.addWidget(check_update_btn)
 
         # Safety: Force Download + Install (helps if detection breaks)
         force_btn = QPushButton("🛠 Safety: Download + Install")
-        def do_force_install():
-            reply = QMessageBox.question(
-                dialog,
-                "Force Install",
-                "This will download the latest client and reinstall it.\n\n"
-                "Your protected folders (minimap, conf, characterdata) will be preserved.\n\n"
-                "Proceed?",
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.Yes
-            )
-            if reply == QMessageBox.Yes:
-                dialog.accept()
-                # Kick off download/install regardless of current status
-                try:
-                    self.log_message("🛠 Starting safety download + install...")
-                except Exception:
-                    pass
-                self.download_and_install()
-        force_btn.clicked.connect(do_force_install)
+        force_btn.clicked.connect(self._config_force_install)
         update_layout.addWidget(force_btn)
         layout.addWidget(update_group)
 
@@ -1153,42 +1539,13 @@ QTextEdit#log_text {
         launcher_layout.addWidget(launcher_info)
 
         check_launcher_btn = QPushButton("🧰 Check for Launcher Update")
-        def do_manual_launcher_update():
-            try:
-                if not getattr(sys, 'frozen', False):
-                    QMessageBox.information(dialog, "Not Packaged",
-                                            "Launcher self-update is only available in the packaged EXE.")
-                    return
-                status = self.launcher_core.check_launcher_update()
-                if not status or not isinstance(status, dict):
-                    QMessageBox.warning(dialog, "Update Check",
-                                        "Could not determine launcher update status.")
-                    return
-                if not status.get('available'):
-                    QMessageBox.information(dialog, "Up to date",
-                                            "No new launcher version available.")
-                    return
-                latest = status.get('latest_version', 'unknown')
-                url = status.get('download_url')
-                if not url:
-                    QMessageBox.warning(dialog, "Update Check",
-                                        "No download URL provided by release.")
-                    return
-                # Prompt to proceed
-                reply = QMessageBox.question(
-                    dialog,
-                    "Update Launcher",
-                    f"A new launcher version {latest} is available.\nInstall now?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.Yes
-                )
-                if reply == QMessageBox.Yes:
-                    dialog.accept()
-                    self.download_and_apply_launcher_update(url)
-            except Exception as e:
-                QMessageBox.critical(dialog, "Error", f"Failed to check/apply launcher update: {e}")
-        check_launcher_btn.clicked.connect(do_manual_launcher_update)
+        if IS_FROZEN:
+            check_launcher_btn.clicked.connect(self._config_manual_launcher_update)
+        else:
+            check_launcher_btn.setEnabled(False)
+            check_launcher_btn.setToolTip("Launcher self-update is only available in the packaged EXE.")
         launcher_layout.addWidget(check_launcher_btn)
+        self._check_launcher_btn = check_launcher_btn
         layout.addWidget(launcher_group)
         
         # Close button
@@ -1199,20 +1556,125 @@ QTextEdit#log_text {
         # Apply dark styling to dialog
         dialog.setStyleSheet(self.styleSheet())
         
-        dialog.exec()
+        return dialog
+
+    def _config_open_folder(self):
+        path = self.launcher_core.tibia_dir
+        try:
+            os.makedirs(path, exist_ok=True)
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to open folder: {e}")
+
+    def _config_manual_update(self):
+        dialog = self._config_dialog
+        try:
+            status = self.launcher_core.check_tibia_version_status()
+            cur = status.get('current_version', 'Unknown')
+            latest = status.get('latest_version', 'Unknown')
+            if status.get('update_available'):
+                reply = QMessageBox.question(
+                    dialog,
+                    "Update Available",
+                    f"A new update is available.\n\nCurrent: {cur}\nLatest: {latest}\n\nDownload and install now?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.Yes
+                )
+                if reply == QMessageBox.Yes:
+                    dialog.accept()
+                    self.download_and_install()
+            else:
+                QMessageBox.information(dialog, "Up to date", f"No updates available.\nCurrent: {cur}\nLatest: {latest}")
+        except Exception as e:
+            QMessageBox.critical(dialog, "Error", f"Failed to check updates: {e}")
+
+    def _config_force_install(self):
+        dialog = self._config_dialog
+        reply = QMessageBox.question(
+            dialog,
+            "Force Install",
+            "This will download the latest client and reinstall it.\n\n"
+            "Your protected folders (minimap, conf, characterdata) will be preserved.\n\n"
+            "Proceed?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.Yes
+        )
+        if reply == QMessageBox.Yes:
+            dialog.accept()
+            # Kick off download/install regardless of current status
+            try:
+                self.log_message("🛠 Starting safety download + install...")
+            except Exception:
+                pass
+            self.download_and_install()
+
+    def _config_manual_launcher_update(self):
+        # The GitHub round trip runs off the UI thread so the dialog stays responsive;
+        # the outcome comes back through launcher_status_signal
+        self._check_launcher_btn.setEnabled(False)
+
+        def worker():
+            try:
+                status = self.launcher_core.check_launcher_update()
+            except Exception as e:
+                status = e
+            self.launcher_status_signal.emit(status)
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def _on_manual_launcher_status(self, status):
+        dialog = self._config_dialog
+        self._check_launcher_btn.setEnabled(True)
+        try:
+            if isinstance(status, Exception):
+                raise status
+            if not status or not isinstance(status, dict):
+                QMessageBox.warning(dialog, "Update Check",
+                                    "Could not determine launcher update status.")
+                return
+            if not status.get('available'):
+                QMessageBox.information(dialog, "Up to date",
+                                        "No new launcher version available.")
+                return
+            latest = status.get('latest_version', 'unknown')
+            url = status.get('download_url')
+            if not url:
+                QMessageBox.warning(dialog, "Update Check",
+                                    "No download URL provided by release.")
+                return
+            # Prompt to proceed, downloading in the meantime
+            self._prefetch_launcher_update(url, status.get('sha256'))
+            reply = QMessageBox.question(
+                dialog,
+                "Update Launcher",
+                f"A new launcher version {latest} is available.\nInstall now?",
+                QMessageBox.Yes | QMessageBox.No,
+                QMessageBox.Yes
+            )
+            if reply == QMessageBox.Yes:
+                dialog.accept()
+                self.download_and_apply_launcher_update(url, status.get('sha256'))
+        except Exception as e:
+            QMessageBox.critical(dialog, "Error", f"Failed to check/apply launcher update: {e}")
 
     # Removed first-run prompt and manual browse: location is fixed to %APPDATA%
 
 
 def main():
     """Main function to run the PySide6 launcher"""
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("TIBIA_DEBUG") else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s",
+    )
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Use Fusion style for better dark theme support
-    
+    # Room for the background artwork plus its scaled copies (KB)
+    QPixmapCache.setCacheLimit(20480)
+
     # Set application icon if available
-    icon_path = resource_path('images', 'logo-universal.png')
-    if os.path.exists(icon_path):
-        app.setWindowIcon(QIcon(icon_path))
+    icon = app_icon()
+    if icon is not None:
+        app.setWindowIcon(icon)
     
     launcher = PySide6GamingLauncher()
     launcher.show()
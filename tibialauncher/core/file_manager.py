@@ -6,14 +6,96 @@ backup operations, and file system management.
 """
 
 import os
+import io
+import stat
+import time
+import errno
+import hashlib
+import functools
+import contextlib
 import shutil
+import zlib
 import zipfile
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
 
+@functools.lru_cache(maxsize=16)
+def _exclude_prefixes(folders):
+    """Every excluded-folder prefix, with either separator, for one C-level str.startswith"""
+    return tuple(f"{folder}{sep}" for folder in folders for sep in ('/', '\\'))
+
+
+class BufferFile(io.RawIOBase):
+    """Seekable binary file over an existing buffer (bytes, bytearray or memoryview)
+    
+    Unlike io.BytesIO, nothing is copied: reads and writes go straight through a
+    memoryview, and the size is fixed, so a preallocated bytearray is filled in
+    place and several readers can share one archive without duplicating it.
+    """
+    
+    def __init__(self, buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast('B')
+        self._pos = 0
+    
+    def readable(self):
+        return True
+    
+    def writable(self):
+        return not self._view.readonly
+    
+    def seekable(self):
+        return True
+    
+    def getbuffer(self):
+        """A memoryview of the whole buffer (shared, not copied)"""
+        return self._view
+    
+    def tell(self):
+        return self._pos
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._pos = offset
+        return offset
+    
+    def read(self, size=-1):
+        end = len(self._view) if size is None or size < 0 else min(self._pos + size, len(self._view))
+        data = self._view[self._pos:end].tobytes() if end > self._pos else b''
+        self._pos += len(data)
+        return data
+    
+    def readinto(self, b):
+        data = self._view[self._pos:self._pos + len(b)]
+        n = len(data)
+        b[:n] = data
+        self._pos += n
+        return n
+    
+    def write(self, b):
+        end = self._pos + len(b)
+        if end > len(self._view):
+            raise IOError(f"write past the end of a {len(self._view)}-byte buffer")
+        self._view[self._pos:end] = b
+        self._pos = end
+        return len(b)
+
+
 class FileManager:
+    # Buffer for copying zip members to disk (ZipFile.extract uses 64 KiB)
+    COPY_BUFFER_SIZE = 1024 * 1024
+    # Archive sources that each worker thread can open independently
+    _REOPENABLE_SOURCES = (str, os.PathLike, bytes, bytearray, memoryview)
+    
     def __init__(self):
         self.protected_folders = ['minimap', 'conf', 'character data']
         self.protected_files = [
@@ -21,6 +103,39 @@ class FileManager:
             'version.txt'
         ]
     
+    @property
+    def protected_folders(self):
+        return self._protected_folders
+    
+    @protected_folders.setter
+    def protected_folders(self, folders):
+        self._protected_folders = folders
+        self._protected_names = None
+    
+    @property
+    def protected_files(self):
+        return self._protected_files
+    
+    @protected_files.setter
+    def protected_files(self, files):
+        self._protected_files = files
+        self._protected_names = None
+    
+    def _get_protected_names(self):
+        """normcase'd protected folder and file names, rebuilt only after the lists are reassigned"""
+        if self._protected_names is None:
+            self._protected_names = frozenset(
+                os.path.normcase(name) for name in self._protected_folders + self._protected_files)
+        return self._protected_names
+    
+    @staticmethod
+    def _stat_or_none(path):
+        """os.stat(path), or None if it doesn't exist - one syscall for existence, type and size"""
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+    
     def create_backup(self, source_dir, backup_dir, folders_to_backup=None):
         """Create a backup of specified folders"""
         if folders_to_backup is None:
@@ -34,36 +149,38 @@ class FileManager:
         
         os.makedirs(backup_dir, exist_ok=True)
         
+        # Collected as columns; item dicts are only built once, for the result
+        names, types, sizes = [], [], []
         for item_name in folders_to_backup:
             source_path = os.path.join(source_dir, item_name)
+            source_stat = self._stat_or_none(source_path)
             
-            if os.path.exists(source_path):
+            if source_stat is not None:
                 dest_path = os.path.join(backup_dir, item_name)
                 
                 try:
-                    if os.path.isdir(source_path):
-                        shutil.copytree(source_path, dest_path)
-                        backup_info['backed_up_items'].append({
-                            'name': item_name,
-                            'type': 'directory',
-                            'size': self.get_directory_size(source_path)
-                        })
+                    if stat.S_ISDIR(source_stat.st_mode):
+                        item_type, item_size = 'directory', self.copy_tree_parallel(source_path, dest_path)
                     else:
                         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
                         shutil.copy2(source_path, dest_path)
-                        backup_info['backed_up_items'].append({
-                            'name': item_name,
-                            'type': 'file',
-                            'size': os.path.getsize(source_path)
-                        })
+                        item_type, item_size = 'file', source_stat.st_size
+                    names.append(item_name)
+                    types.append(item_type)
+                    sizes.append(item_size)
                         
                 except Exception as e:
                     print(f"Warning: Could not backup {item_name}: {e}")
         
+        backup_info['backed_up_items'] = self._item_dicts(names, types, sizes)
         return backup_info
     
-    def restore_backup(self, backup_dir, target_dir, items_to_restore=None):
-        """Restore backed up items to target directory"""
+    def restore_backup(self, backup_dir, target_dir, items_to_restore=None, move=False):
+        """Restore backed up items to target directory
+        
+        With move=True the items are moved out of the backup instead of copied,
+        which is a constant-time rename when both are on the same filesystem.
+        """
         if not os.path.exists(backup_dir):
             return False
         
@@ -74,21 +191,21 @@ class FileManager:
         
         for item_name in items_to_restore:
             source_path = os.path.join(backup_dir, item_name)
+            source_stat = self._stat_or_none(source_path)
             
-            if os.path.exists(source_path):
+            if source_stat is not None:
                 dest_path = os.path.join(target_dir, item_name)
                 
                 try:
                     # Remove existing item if it exists
-                    if os.path.exists(dest_path):
-                        if os.path.isdir(dest_path):
-                            shutil.rmtree(dest_path)
-                        else:
-                            os.remove(dest_path)
+                    if self._stat_or_none(dest_path) is not None:
+                        self.discard_path(dest_path)
                     
                     # Restore from backup
-                    if os.path.isdir(source_path):
-                        shutil.copytree(source_path, dest_path)
+                    if move:
+                        self.move_into_place(source_path, dest_path)
+                    elif stat.S_ISDIR(source_stat.st_mode):
+                        self.copy_tree_parallel(source_path, dest_path)
                     else:
                         os.makedirs(os.path.dirname(dest_path), exist_ok=True)
                         shutil.copy2(source_path, dest_path)
@@ -101,47 +218,395 @@ class FileManager:
         return restored_items
     
     def extract_zip_selective(self, zip_path, extract_to, exclude_folders=None):
-        """Extract zip file while excluding specified folders"""
+        """Extract zip file while excluding specified folders
+        
+        Paths and archive bytes are extracted in parallel (see extract_zip_parallel).
+        zip_path may also be an open binary file, e.g. the spooled download from
+        GitHubDownloader.download_to_spool, which is extracted sequentially.
+        """
         if exclude_folders is None:
             exclude_folders = self.protected_folders
         
         extracted_files = []
         skipped_files = []
+        members = []
+        # Each worker can open its own handle on a path or on bytes; an open file has
+        # one seek position shared by every reader, so it is extracted sequentially
+        parallel = isinstance(zip_path, self._REOPENABLE_SOURCES)
         
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            for member in zip_ref.namelist():
-                # Check if file is in excluded folder
-                should_skip = False
-                for exclude_folder in exclude_folders:
-                    if member.startswith(f"{exclude_folder}/") or member.startswith(f"{exclude_folder}\\"):
-                        should_skip = True
-                        skipped_files.append(member)
-                        break
-                
-                if not should_skip:
+        exclude_prefixes = _exclude_prefixes(tuple(exclude_folders))
+        
+        with contextlib.ExitStack() as stack:
+            zip_ref = self._open_zip(zip_path, stack)
+            # ZipInfo objects from the already-parsed central directory, so no
+            # per-member getinfo() lookups are needed later
+            for info in zip_ref.infolist():
+                # Check if file is in excluded folder - excluded members are never opened
+                if info.filename.startswith(exclude_prefixes):
+                    skipped_files.append(info.filename)
+                else:
+                    members.append(info)
+            
+            if not parallel:
+                for info in self.make_skeleton(extract_to, members):
                     try:
-                        zip_ref.extract(member, extract_to)
-                        extracted_files.append(member)
+                        self.extract_member(zip_ref, info, extract_to, make_parents=False)
+                        extracted_files.append(info.filename)
                     except Exception as e:
-                        print(f"Warning: Could not extract {member}: {e}")
+                        print(f"Warning: Could not extract {info.filename}: {e}")
+        
+        if parallel:
+            extracted_files = self.extract_zip_parallel(zip_path, extract_to, members)
         
         return {
             'extracted_files': extracted_files,
             'skipped_files': skipped_files
         }
     
-    def get_directory_size(self, directory):
-        """Calculate total size of a directory"""
+    @staticmethod
+    def _safe_member_path(extract_to, member_name):
+        """Map a zip member name to a path under extract_to (same sanitizing as ZipFile.extract)"""
+        arcname = member_name.replace('/', os.sep)
+        if os.altsep:
+            arcname = arcname.replace(os.altsep, os.sep)
+        arcname = os.path.splitdrive(arcname)[1]
+        parts = [x for x in arcname.split(os.sep) if x not in ('', os.curdir, os.pardir)]
+        if not parts:
+            return os.fspath(extract_to)
+        # The parts are already clean, so join them with one C-level str.join instead
+        # of having os.path.join re-check every component
+        return os.path.join(extract_to, os.sep.join(parts))
+    
+    @classmethod
+    def extract_member(cls, zip_ref, member, extract_to, make_parents=True):
+        """Extract one zip member (name or ZipInfo) under extract_to and return its path
+        
+        Same result as ZipFile.extract, but the data is copied with a 1 MiB buffer
+        so large game files take far fewer inflate/write round trips. Callers that
+        ran make_skeleton first pass make_parents=False to skip the per-file makedirs.
+        """
+        info = member if isinstance(member, zipfile.ZipInfo) else zip_ref.getinfo(member)
+        target = cls._safe_member_path(extract_to, info.filename)
+        if info.is_dir():
+            os.makedirs(target, exist_ok=True)
+            return target
+        
+        if make_parents:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Write beside the target and swap it in, so an existing file that is hard
+        # linked elsewhere (clone_item backups) is replaced rather than truncated
+        temp_path = target + '.extracting'
+        try:
+            with zip_ref.open(info) as src, open(temp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst, cls.COPY_BUFFER_SIZE)
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+        return target
+    
+    @classmethod
+    def make_skeleton(cls, extract_to, members):
+        """Create every directory the members (names or ZipInfo) need; return the file members
+        
+        Each distinct directory is created once, parents first, so directory entries
+        never reach the extractor and files need no makedirs of their own.
+        """
+        file_members = []
+        directories = set()
+        for member in members:
+            name = member.filename if isinstance(member, zipfile.ZipInfo) else member
+            target = cls._safe_member_path(extract_to, name)
+            if name.endswith('/'):
+                directories.add(target)
+            else:
+                directories.add(os.path.dirname(target))
+                file_members.append(member)
+        for directory in sorted(directories):
+            os.makedirs(directory, exist_ok=True)
+        return file_members
+    
+    @classmethod
+    def _open_zip(cls, source, stack):
+        """Open a ZipFile on an ExitStack from a path, archive bytes or an open binary file"""
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            # Each worker gets its own position over the shared bytes, not its own copy
+            source = BufferFile(source)
+        elif isinstance(source, (str, os.PathLike)):
+            # Read through a large buffer; zipfile itself issues many small reads
+            source = stack.enter_context(open(source, 'rb', buffering=cls.COPY_BUFFER_SIZE))
+        return stack.enter_context(zipfile.ZipFile(source, 'r'))
+    
+    def extract_zip_parallel(self, zip_path, extract_to, members=None, max_workers=None, progress_callback=None,
+                             extract=None):
+        """Extract zip members concurrently, one ZipFile handle per worker thread.
+        
+        Decompression releases the GIL, so spreading members across threads
+        overlaps inflate work with disk writes. Directories are created up front
+        so workers never race on makedirs. zip_path may also be the archive
+        bytes, and members may be names or ZipInfo objects (which spare each
+        worker a getinfo() lookup). extract(zip_ref, member, extract_to) replaces
+        extract_member for callers that need their own per-member handling.
+        Returns the names of the extracted members.
+        """
+        if members is None:
+            with contextlib.ExitStack() as stack:
+                members = self._open_zip(zip_path, stack).infolist()
+        
+        # Create the directory skeleton serially, then only hand files to workers
+        file_members = [
+            (member.filename if isinstance(member, zipfile.ZipInfo) else member, member)
+            for member in self.make_skeleton(extract_to, members)
+        ]
+        
+        # ZipFile handles share a seek position, so each thread opens its own
+        local = threading.local()
+        handles = []
+        handles_lock = threading.Lock()
+        extract = extract or functools.partial(self.extract_member, make_parents=False)
+        
+        def extract_one(name, member):
+            zip_ref = getattr(local, 'zip_ref', None)
+            if zip_ref is None:
+                with contextlib.ExitStack() as stack:
+                    zip_ref = local.zip_ref = self._open_zip(zip_path, stack)
+                    with handles_lock:
+                        handles.append(stack.pop_all())
+            extract(zip_ref, member, extract_to)
+            return name
+        
+        extracted_files = []
+        total = len(file_members)
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(extract_one, name, member): name for name, member in file_members}
+                for future in as_completed(futures):
+                    try:
+                        extracted_files.append(future.result())
+                    except Exception as e:
+                        print(f"Warning: Could not extract {futures[future]}: {e}")
+                    if progress_callback:
+                        progress_callback(len(extracted_files), total)
+        finally:
+            for handle in handles:
+                handle.close()
+        
+        return extracted_files
+    
+    @staticmethod
+    def copy_tree_parallel(src, dst, max_workers=None):
+        """Copy a directory tree, handing the file copies to a thread pool.
+        
+        The tree is walked once with os.scandir and the directory skeleton is
+        created serially. shutil.copyfile uses the OS fast-copy path (sendfile,
+        fcopyfile or CopyFile) which releases the GIL, so trees of many small
+        files copy concurrently. Metadata is copied once per directory rather
+        than once per file. Returns the total size of the copied files, taken
+        from the same walk, so callers don't need to size the tree again.
+        """
+        directories = []
+        files = []
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except (OSError, FileNotFoundError):
-                    pass
+        pending = [(src, dst)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            os.makedirs(dst_dir, exist_ok=True)
+            directories.append((src_dir, dst_dir))
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    target = os.path.join(dst_dir, entry.name)
+                    if entry.is_dir():
+                        pending.append((entry.path, target))
+                    else:
+                        files.append((entry.path, target))
+                        total_size += entry.stat().st_size
+        
+        workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(shutil.copyfile, source, target) for source, target in files]
+            for future in futures:
+                future.result()
+        
+        # After every file is written, so the copied directory mtimes stick
+        for src_dir, dst_dir in directories:
+            shutil.copystat(src_dir, dst_dir)
         return total_size
     
+    def clone_item(self, src, dst):
+        """Copy a file or directory tree, using hard links when src and dst share a filesystem.
+        
+        Linking only writes directory entries, so large protected folders are
+        "copied" without reading or writing their data. Linked files share their
+        contents, so this only suits copies where neither side is rewritten in
+        place; extract_member replaces files instead of overwriting them. Falls
+        back to a real copy across devices or on filesystems without hard links (FAT32).
+        """
+        parent = os.path.dirname(os.path.abspath(dst))
+        os.makedirs(parent, exist_ok=True)
+        if os.stat(src).st_dev == os.stat(parent).st_dev:
+            try:
+                if not os.path.isdir(src):
+                    os.link(src, dst)
+                    return
+                pending = [(src, dst)]
+                while pending:
+                    src_dir, dst_dir = pending.pop()
+                    os.makedirs(dst_dir, exist_ok=True)
+                    with os.scandir(src_dir) as entries:
+                        for entry in entries:
+                            target = os.path.join(dst_dir, entry.name)
+                            if entry.is_dir():
+                                pending.append((entry.path, target))
+                            else:
+                                os.link(entry.path, target)
+                return
+            except OSError:
+                # Links refused part-way: discard the partial clone and copy instead
+                if os.path.isdir(dst):
+                    shutil.rmtree(dst, ignore_errors=True)
+                elif os.path.exists(dst):
+                    os.remove(dst)
+        
+        if os.path.isdir(src):
+            self.copy_tree_parallel(src, dst)
+        else:
+            shutil.copy2(src, dst)
+    
+    @staticmethod
+    def file_sha256(path):
+        """Return the hex SHA-256 of a file, or None if it can't be read"""
+        try:
+            with open(path, 'rb') as f:
+                if hasattr(hashlib, 'file_digest'):  # Python 3.11+: hashed in C
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                digest = hashlib.sha256()
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(block)
+                return digest.hexdigest()
+        except OSError:
+            return None
+    
+    @classmethod
+    def _tally_tree(cls, path):
+        """Return (folder_count, file_count, total_size) for everything below path
+        
+        Walks with os.scandir: DirEntry already knows its type from the directory
+        read (and on Windows its size too), so each file costs at most one stat
+        call instead of a join plus getsize. Unreadable entries are skipped.
+        """
+        folders = files = size = 0
+        subdirs = []
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            folders += 1
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        else:
+                            files += 1
+                            size += entry.stat().st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        
+        for subdir in subdirs:
+            sub_folders, sub_files, sub_size = cls._tally_tree(subdir)
+            folders += sub_folders
+            files += sub_files
+            size += sub_size
+        return folders, files, size
+    
+    @classmethod
+    def _index_tree(cls, root, prefix=''):
+        """Map every file below root to its size, keyed by normcase'd relative path"""
+        index = {}
+        subdirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    relpath = prefix + entry.name
+                    try:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                subdirs.append((entry.path, relpath + os.sep))
+                        else:
+                            index[os.path.normcase(relpath)] = entry.stat().st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+        
+        for subdir, subprefix in subdirs:
+            index.update(cls._index_tree(subdir, subprefix))
+        return index
+    
+    @staticmethod
+    def _item_dicts(names, types, sizes):
+        """Build the {name, type, size} item dicts returned to callers from parallel columns"""
+        return [{'name': n, 'type': t, 'size': s} for n, t, s in zip(names, types, sizes)]
+    
+    @staticmethod
+    def file_crc32(path):
+        """Return the CRC-32 of a file (as stored in zip headers), or None if it can't be read"""
+        try:
+            with open(path, 'rb') as f:
+                crc = 0
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    crc = zlib.crc32(block, crc)
+                return crc
+        except OSError:
+            return None
+    
+    def move_into_place(self, source, dest):
+        """Move source to dest: an O(1) rename on the same filesystem.
+        
+        Across filesystems (EXDEV) the item is copied instead and the source is
+        left where it is.
+        """
+        try:
+            os.replace(source, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            if os.path.isdir(source):
+                self.copy_tree_parallel(source, dest)
+            else:
+                shutil.copy2(source, dest)
+    
+    @staticmethod
+    def discard_path(path, trash_dir=None):
+        """Delete a file or directory tree.
+        
+        With trash_dir (a directory that is deleted later anyway, such as an
+        update's temporary directory on the same volume) the item is just renamed
+        into it, so its name is free again without waiting for a large delete.
+        Otherwise, or if that rename fails, it is deleted inline.
+        """
+        if trash_dir is not None:
+            trash = os.path.join(trash_dir, f"{os.path.basename(path)}.discard_{time.time_ns()}")
+            try:
+                os.replace(path, trash)
+                return
+            except OSError:
+                pass
+        
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    
+    def get_directory_size(self, directory):
+        """Calculate total size of a directory"""
+        return self._tally_tree(directory)[2]
+    
     def get_directory_info(self, directory):
         """Get comprehensive information about a directory"""
         if not os.path.exists(directory):
@@ -157,37 +622,50 @@ class FileManager:
             'last_modified': None
         }
         
+        names, types, sizes = [], [], []
         try:
             # Get basic stats
             stat_info = os.stat(directory)
             info['last_modified'] = datetime.fromtimestamp(stat_info.st_mtime).isoformat()
             
-            # Count files and folders, calculate size
-            for dirpath, dirnames, filenames in os.walk(directory):
-                info['folder_count'] += len(dirnames)
-                info['file_count'] += len(filenames)
-                
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
+            # Count files and folders, calculate size - one pass, remembering each
+            # top-level protected item so the check below doesn't probe them again
+            protected_names = self._get_protected_names()
+            top_level = {}
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    key = os.path.normcase(entry.name)
                     try:
-                        info['size'] += os.path.getsize(filepath)
-                    except (OSError, FileNotFoundError):
+                        if entry.is_dir():
+                            info['folder_count'] += 1
+                            item_size = 0
+                            if not entry.is_symlink():
+                                sub_folders, sub_files, item_size = self._tally_tree(entry.path)
+                                info['folder_count'] += sub_folders
+                                info['file_count'] += sub_files
+                            if key in protected_names:
+                                top_level[key] = ('directory', item_size)
+                        else:
+                            info['file_count'] += 1
+                            item_size = entry.stat().st_size
+                            if key in protected_names:
+                                top_level[key] = ('file', item_size)
+                        info['size'] += item_size
+                    except OSError:
                         pass
             
-            # Check for protected items
+            # Report protected items in configured order
             for item_name in self.protected_folders + self.protected_files:
-                item_path = os.path.join(directory, item_name)
-                if os.path.exists(item_path):
-                    item_info = {
-                        'name': item_name,
-                        'type': 'directory' if os.path.isdir(item_path) else 'file',
-                        'size': self.get_directory_size(item_path) if os.path.isdir(item_path) else os.path.getsize(item_path)
-                    }
-                    info['protected_items_present'].append(item_info)
+                item = top_level.get(os.path.normcase(item_name))
+                if item:
+                    names.append(item_name)
+                    types.append(item[0])
+                    sizes.append(item[1])
                     
         except Exception as e:
             print(f"Error getting directory info: {e}")
         
+        info['protected_items_present'] = self._item_dicts(names, types, sizes)
         return info
     
     def cleanup_temp_files(self, temp_dir):
@@ -200,8 +678,13 @@ class FileManager:
             print(f"Warning: Could not clean up temp files: {e}")
         return False
     
-    def verify_extraction(self, zip_path, extract_dir):
-        """Verify that extraction was successful"""
+    def verify_extraction(self, zip_path, extract_dir, check_crc=False, max_workers=None):
+        """Verify that extraction was successful
+        
+        Files are checked for presence and size. With check_crc, files whose size
+        matches are also re-read and compared against the CRC-32 stored in the
+        zip, several files at a time (zlib.crc32 releases the GIL).
+        """
         verification_info = {
             'success': True,
             'missing_files': [],
@@ -211,25 +694,38 @@ class FileManager:
         }
         
         try:
+            # One scandir pass up front instead of exists() + getsize() per member
+            extracted = self._index_tree(extract_dir)
+            
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_files = [f for f in zip_ref.namelist() if not f.endswith('/')]
-                verification_info['total_files_in_zip'] = len(zip_files)
+                zip_infos = [info for info in zip_ref.infolist() if not info.is_dir()]
+                verification_info['total_files_in_zip'] = len(zip_infos)
+                crc_candidates = []
                 
-                for zip_file in zip_files:
-                    extracted_path = os.path.join(extract_dir, zip_file)
+                for zip_info in zip_infos:
+                    size = extracted.get(os.path.normcase(zip_info.filename))
                     
-                    if os.path.exists(extracted_path):
+                    if size is None:
+                        verification_info['missing_files'].append(zip_info.filename)
+                    else:
                         verification_info['total_files_extracted'] += 1
                         
                         # Basic size check
-                        try:
-                            zip_info = zip_ref.getinfo(zip_file)
-                            if os.path.getsize(extracted_path) != zip_info.file_size:
-                                verification_info['corrupted_files'].append(zip_file)
-                        except Exception:
-                            pass  # Skip size verification if there's an issue
-                    else:
-                        verification_info['missing_files'].append(zip_file)
+                        if size != zip_info.file_size:
+                            verification_info['corrupted_files'].append(zip_info.filename)
+                        elif check_crc:
+                            crc_candidates.append(zip_info)
+                
+                if crc_candidates:
+                    def crc_matches(zip_info):
+                        path = self._safe_member_path(extract_dir, zip_info.filename)
+                        return self.file_crc32(path) == zip_info.CRC
+                    
+                    workers = max_workers or min(8, os.cpu_count() or 1)
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        for zip_info, ok in zip(crc_candidates, executor.map(crc_matches, crc_candidates)):
+                            if not ok:
+                                verification_info['corrupted_files'].append(zip_info.filename)
                 
                 if verification_info['missing_files'] or verification_info['corrupted_files']:
                     verification_info['success'] = False
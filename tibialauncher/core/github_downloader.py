@@ -6,11 +6,58 @@ Handles downloading files from GitHub releases, specifically for the tibia repos
 
 import os
 import json
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
+from .file_manager import BufferFile
+
+try:
+    import orjson
+except ImportError:  # optional: several times faster on large release listings
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, with orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the
+    same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False):
+    """Serialize obj to a JSON str (compact, or 2-space indented), with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(',', ':'))
 
 
 class GitHubDownloader:
+    # (connect, read) seconds used when a call doesn't pass its own timeout
+    DEFAULT_TIMEOUT = (3, 30)
+    # Archives up to this size are buffered in memory; larger ones spill to a temp file
+    SPOOL_MAX_SIZE = 256 * 1024 * 1024
+    # Read size for streamed downloads; small chunks make the Python loop the bottleneck
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    # Downloads at least this large are split into parallel byte-range requests
+    RANGED_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024
+    RANGED_DOWNLOAD_PARTS = 4
+    # Largest page size GitHub allows for list endpoints
+    RELEASES_PER_PAGE = 100
+    # Release assets are already compressed; asking for the raw bytes keeps
+    # Content-Length equal to the body size and leaves byte ranges usable
+    BINARY_HEADERS = {'Accept-Encoding': 'identity'}
+    
     def __init__(self):
         self.repo_owner = "hecmo94"
         self.repo_name = "testclient"
@@ -25,6 +72,66 @@ class GitHubDownloader:
             'User-Agent': 'Tibia-Launcher/1.0',
             'Accept': 'application/vnd.github.v3+json'
         })
+        # Keep-alive pool shared by every request the launcher makes; retries cover connect
+        # failures and transient gateway errors with a short backoff
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # url -> (etag, last_modified, body) for conditional revalidation
+        self._validators = {}
+        # url -> (body text, parsed JSON) so an unchanged body isn't parsed again
+        self._parsed = {}
+    
+    def get_http_validators(self):
+        """Return the stored revalidation data as a JSON-serializable dict"""
+        return {url: list(entry) for url, entry in dict(self._validators).items()}
+    
+    def set_http_validators(self, validators):
+        """Restore revalidation data produced by get_http_validators()"""
+        for url, entry in validators.items():
+            if isinstance(entry, (list, tuple)) and len(entry) == 3:
+                self._validators[url] = tuple(entry)
+    
+    def _get_text(self, url, timeout=DEFAULT_TIMEOUT):
+        """GET ``url`` and return the body text, revalidating a previously fetched copy.
+
+        Sends If-None-Match / If-Modified-Since from the last successful response,
+        so unchanged metadata comes back as a bodiless 304 (which GitHub also does
+        not count against the API rate limit).
+        """
+        headers = {}
+        cached = self._validators.get(url)
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        response = self.session.get(url, timeout=timeout, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[2]
+        response.raise_for_status()
+        
+        # response.text decodes the body on every access, so read it once
+        text = response.text
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._validators[url] = (etag, last_modified, text)
+        return text
+    
+    def _get_json(self, url, timeout=DEFAULT_TIMEOUT):
+        """GET and parse JSON through _get_text; a 304 reuses the object parsed last time"""
+        text = self._get_text(url, timeout)
+        cached = self._parsed.get(url)
+        if cached is not None and cached[0] is text:
+            return cached[1]
+        data = json_loads(text)
+        if url in self._validators:
+            self._parsed[url] = (text, data)
+        return data
     
     def get_remote_config(self):
         """Get the launcher configuration from the remote repository"""
@@ -39,9 +146,7 @@ class GitHubDownloader:
                     config_text = f.read().strip()
             elif test_config_url:
                 # Load from custom URL for testing
-                response = self.session.get(test_config_url, timeout=10)
-                response.raise_for_status()
-                config_text = response.text.strip()
+                config_text = self._get_text(test_config_url).strip()
             else:
                 # Normal production config - try launcher_config.json first, then fall back
                 config_urls = [
@@ -52,9 +157,7 @@ class GitHubDownloader:
                 config_text = None
                 for url in config_urls:
                     try:
-                        response = self.session.get(url, timeout=10)
-                        response.raise_for_status()
-                        config_text = response.text.strip()
+                        config_text = self._get_text(url).strip()
                         break
                     except requests.exceptions.RequestException:
                         continue
@@ -64,7 +167,7 @@ class GitHubDownloader:
             
             # Parse the config (assuming it's JSON format)
             try:
-                config_data = json.loads(config_text)
+                config_data = json_loads(config_text)
                 
                 # Update repository settings from the new easy config format
                 self._update_repo_from_config(config_data)
@@ -92,10 +195,7 @@ class GitHubDownloader:
         try:
             url = f"{self.api_base_url}/repos/{self.repo_owner}/{self.repo_name}/releases/tags/{tag}"
             
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            release_data = response.json()
+            release_data = self._get_json(url)
             return release_data
             
         except requests.exceptions.RequestException as e:
@@ -105,15 +205,16 @@ class GitHubDownloader:
             print(f"Error parsing release JSON: {e}")
             return None
 
-    def get_latest_release(self):
-        """Get the latest release information from GitHub (fallback method)"""
+    def get_latest_release(self, repo_owner=None, repo_name=None):
+        """Get the latest release information from GitHub (fallback method)
+        
+        Defaults to the client repository; pass repo_owner/repo_name to look up
+        another one (e.g. the launcher's own) over the same revalidating session.
+        """
         try:
-            url = f"{self.api_base_url}/repos/{self.repo_owner}/{self.repo_name}/releases/latest"
-            
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            url = f"{self.api_base_url}/repos/{repo_owner or self.repo_owner}/{repo_name or self.repo_name}/releases/latest"
             
-            release_data = response.json()
+            release_data = self._get_json(url)
             return release_data
             
         except requests.exceptions.RequestException as e:
@@ -128,11 +229,16 @@ class GitHubDownloader:
         try:
             url = f"{self.api_base_url}/repos/{self.repo_owner}/{self.repo_name}/releases"
             
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            releases_data = self.session.get(url, timeout=10).json()
-            return releases_data
+            # Fetch full pages until a short one; each page URL is revalidated on its own
+            releases_data = []
+            page = 1
+            while True:
+                page_url = f"{url}?per_page={self.RELEASES_PER_PAGE}&page={page}"
+                page_data = self._get_json(page_url, timeout=10)
+                releases_data.extend(page_data)
+                if len(page_data) < self.RELEASES_PER_PAGE:
+                    return releases_data
+                page += 1
             
         except requests.exceptions.RequestException as e:
             print(f"Error fetching releases: {e}")
@@ -176,27 +282,122 @@ class GitHubDownloader:
             'download_count': asset.get('download_count', 0)
         }
     
-    def download_file(self, url, local_path, progress_callback=None):
-        """Download a file from URL with progress tracking"""
+    @staticmethod
+    def _progress_reporter(progress_callback, total_size):
+        """Wrap progress_callback(downloaded, total) so it fires at most ~10 times a second
+        
+        The returned report(downloaded) always passes through the final call once
+        the whole body has arrived. Returns None when there is nothing to report to.
+        """
+        if not progress_callback or total_size <= 0:
+            return None
+        last_report = 0.0
+        
+        def report(downloaded_size):
+            nonlocal last_report
+            now = time.monotonic()
+            if now - last_report >= 0.1 or downloaded_size >= total_size:
+                last_report = now
+                progress_callback(downloaded_size, total_size)
+        return report
+    
+    def _probe_download(self, url):
+        """HEAD ``url`` and return (final_url, size, ranged), or None if that fails
+        
+        size is 0 when the server doesn't report it; ranged is True when byte
+        ranges of the (unencoded) body can be requested.
+        """
         try:
-            response = self.session.get(url, stream=True, timeout=30)
+            response = self.session.head(url, allow_redirects=True, timeout=self.DEFAULT_TIMEOUT,
+                                         headers=self.BINARY_HEADERS)
+            response.raise_for_status()
+        except requests.exceptions.RequestException:
+            return None
+        
+        headers = response.headers
+        ranged = headers.get('accept-ranges', '').lower() == 'bytes' and 'content-encoding' not in headers
+        # Later requests go straight to the redirect target (e.g. GitHub's asset CDN)
+        return response.url, int(headers.get('content-length', 0)), ranged
+    
+    def _stream_ranges(self, url, file, total_size, progress_callback=None, chunk_size=DOWNLOAD_CHUNK_SIZE):
+        """Fetch ``url`` as parallel byte ranges, writing each chunk at its offset in ``file``
+        
+        The connections download concurrently; writes are serialized through a lock
+        with seek + write, so any seekable file object works (including a
+        SpooledTemporaryFile) without per-thread handles or os.pwrite, which
+        Windows lacks.
+        """
+        lock = threading.Lock()
+        report = self._progress_reporter(progress_callback, total_size)
+        downloaded_size = 0
+        
+        def fetch(start, end):
+            nonlocal downloaded_size
+            headers = {**self.BINARY_HEADERS, 'Range': f'bytes={start}-{end}'}
+            with self.session.get(url, headers=headers, stream=True, timeout=self.DEFAULT_TIMEOUT) as response:
+                response.raise_for_status()
+                if response.status_code != 206:
+                    raise requests.exceptions.RequestException("Server ignored the Range header")
+                
+                offset = start
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if chunk:
+                        with lock:
+                            file.seek(offset)
+                            file.write(chunk)
+                            downloaded_size += len(chunk)
+                            if report:
+                                report(downloaded_size)
+                        offset += len(chunk)
+        
+        part_size = -(-total_size // self.RANGED_DOWNLOAD_PARTS)
+        ranges = [(start, min(start + part_size, total_size) - 1) for start in range(0, total_size, part_size)]
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            for future in [executor.submit(fetch, start, end) for start, end in ranges]:
+                future.result()
+        file.seek(total_size)
+    
+    def _stream_to(self, url, file, progress_callback=None, chunk_size=DOWNLOAD_CHUNK_SIZE, probe=None):
+        """Stream the body of ``url`` into an open, seekable binary file object
+        
+        Large downloads from servers that accept byte ranges are split across
+        several connections, which a single congestion-limited connection often
+        can't match. progress_callback(downloaded, total) is rate-limited to about
+        10 calls per second, plus a final call once the whole body has arrived.
+        Pass the result of _probe_download as ``probe`` if it is already known.
+        """
+        if probe is None:
+            probe = self._probe_download(url)
+        if probe:
+            url, size, ranged = probe
+            if ranged and size >= self.RANGED_DOWNLOAD_MIN_SIZE:
+                self._stream_ranges(url, file, size, progress_callback, chunk_size)
+                return
+        
+        with self.session.get(url, stream=True, timeout=self.DEFAULT_TIMEOUT, headers=self.BINARY_HEADERS) as response:
             response.raise_for_status()
             
             total_size = int(response.headers.get('content-length', 0))
+            report = self._progress_reporter(progress_callback, total_size)
             downloaded_size = 0
             
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    file.write(chunk)
+                    downloaded_size += len(chunk)
+                    
+                    # Call progress callback if provided
+                    if report:
+                        report(downloaded_size)
+    
+    def download_file(self, url, local_path, progress_callback=None):
+        """Download a file from URL with progress tracking"""
+        try:
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(local_path), exist_ok=True)
             
             with open(local_path, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        file.write(chunk)
-                        downloaded_size += len(chunk)
-                        
-                        # Call progress callback if provided
-                        if progress_callback and total_size > 0:
-                            progress_callback(downloaded_size, total_size)
+                self._stream_to(url, file, progress_callback)
             
             return True
             
@@ -207,9 +408,47 @@ class GitHubDownloader:
             print(f"Error writing file: {e}")
             return False
     
-    def get_download_info_from_config(self):
-        """Get download information based on remote config"""
-        config = self.get_remote_config()
+    def download_to_spool(self, url, progress_callback=None, max_size=SPOOL_MAX_SIZE):
+        """Download a file into memory (or a temp file if large); return it rewound, None on failure
+        
+        zipfile needs the central directory at the end of the archive, so the body is
+        buffered rather than extracted mid-stream. When the server reports a size
+        within max_size, the body is written in place into one preallocated bytearray
+        (a BufferFile), so it is never regrown or copied; otherwise a
+        SpooledTemporaryFile spills to an anonymous temp file past max_size. Either way
+        there is no named copy to write, re-open and delete. The caller must close the
+        returned file.
+        """
+        probe = self._probe_download(url)
+        size = probe[1] if probe else 0
+        if 0 < size <= max_size:
+            archive = BufferFile(bytearray(size))
+        else:
+            archive = tempfile.SpooledTemporaryFile(max_size=max_size)
+        
+        try:
+            self._stream_to(url, archive, progress_callback, probe=probe)
+            if 0 < size <= max_size and archive.tell() != size:
+                raise IOError(f"Incomplete download: got {archive.tell()} of {size} bytes")
+        except requests.exceptions.RequestException as e:
+            archive.close()
+            print(f"Error downloading file: {e}")
+            return None
+        except IOError as e:
+            archive.close()
+            print(f"Error buffering file: {e}")
+            return None
+        
+        archive.seek(0)
+        return archive
+    
+    def get_download_info_from_config(self, config=None):
+        """Get download information based on remote config
+
+        Pass an already-fetched ``config`` to skip fetching it again.
+        """
+        if config is None:
+            config = self.get_remote_config()
         if not config:
             return None
         
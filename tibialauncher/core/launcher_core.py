@@ -4,20 +4,51 @@ Launcher Core Module (packaged)
 Moved into tibialauncher/core for better project organization.
 """
 import os
-import json
+import hmac
+import hashlib
+import re
 import zipfile
 import shutil
 import tempfile
-import subprocess
 import sys
+import time
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import requests
-from .github_downloader import GitHubDownloader
-from .file_manager import FileManager
+from collections import Counter
+from .github_downloader import GitHubDownloader, json_dumps, json_loads
+from .file_manager import FileManager, BufferFile
+from .version import compare_versions, is_newer_release
+
+
+# Leading 'v'/'V' on a version tag, only when a digit follows ("v1.2" -> "1.2")
+_LEADING_V_RE = re.compile(r'^[vV](?=\d)')
+
+# Player-count phrases scraped from server pages, tried in priority order
+_PLAYER_COUNT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+	r"Players? Online\D+(\d+)",
+	r"Online Players?\D+(\d+)",
+	r"(\d+)\s+players? online",
+	r"(\d+)\s+online now",
+))
+_SMALL_NUMBER_RE = re.compile(r"(\d{1,5})")
+
+# Install locations from the environment, resolved once at import
+_APPDATA = os.environ.get('APPDATA')  # Roaming profile
+_LEGACY_TIBIA_PATHS = (
+	os.path.expandvars(r"%USERPROFILE%\Documents\Tibia"),
+	os.path.expandvars(r"%PROGRAMFILES%\Tibia"),
+	os.path.expandvars(r"%PROGRAMFILES(X86)%\Tibia"),
+)
 
 
 class LauncherCore:
+	# Seconds remote config / release metadata stay fresh before revalidating
+	REMOTE_METADATA_TTL = 600
+	# This should match the version in your launcher; update it when you release new versions
+	LAUNCHER_VERSION = "2.0.0"
+
 	def __init__(self, tibia_dir: str | None = None):
 		"""LauncherCore initializer.
 
@@ -29,6 +60,8 @@ class LauncherCore:
 		# Determine base dir (allow caller override)
 		self.tibia_dir = tibia_dir or self.get_default_tibia_directory()
 		self.github_downloader = GitHubDownloader()
+		# Reuse the downloader's pooled session so repeat requests skip TCP/TLS setup
+		self.http = self.github_downloader.session
 		self.file_manager = FileManager()
         
 		# Default protected folders that should not be overwritten
@@ -43,20 +76,29 @@ class LauncherCore:
 		self.config_file = os.path.join(self.tibia_dir, 'launcher_config.json')
 		# Remote config cache
 		self.remote_config = None
+		# key -> (value, fetched_at) for TTL-cached remote metadata
+		self._fetch_cache = {}
+		# (probe key, version) from the last installed-version lookup
+		self._version_cache = None
+		# (release id, asset) picked by the last _get_launcher_asset call
+		self._launcher_asset = None
 		# Load config (sets last_version if exists)
 		self.load_config()
 		# Mark first run if no recorded version
 		self.first_run = not bool(getattr(self, 'last_version', ''))
 		# Apply portable mode override if flag file present
 		self.enable_portable_mode_if_requested()
+		# Last-known remote metadata from the previous run (shown before the network answers)
+		self.cached_release_info = None
+		self._disk_cache_lock = threading.Lock()
+		self._load_disk_cache()
 		# Debug flags
 		self.debug_players = os.environ.get('LAUNCHER_DEBUG_PLAYERS', '0') == '1'
     
 	def get_default_tibia_directory(self):
 		"""Get the default Tibia installation directory"""
-		appdata = os.path.expandvars(r"%APPDATA%")  # Roaming profile
-		if appdata and os.path.isdir(appdata):
-			preferred = os.path.join(appdata, "Tibia")
+		if _APPDATA and os.path.isdir(_APPDATA):
+			preferred = os.path.join(_APPDATA, "Tibia")
 			# Create it if missing so we commit to this location
 			try:
 				os.makedirs(preferred, exist_ok=True)
@@ -65,13 +107,7 @@ class LauncherCore:
 				pass
 
 		# Fallback sequence (legacy compatibility)
-		legacy_paths = [
-			os.path.expandvars(r"%USERPROFILE%\Documents\Tibia"),
-			os.path.expandvars(r"%PROGRAMFILES%\Tibia"),
-			os.path.expandvars(r"%PROGRAMFILES(X86)%\Tibia"),
-			os.path.join(os.getcwd(), "Tibia")
-		]
-		for path in legacy_paths:
+		for path in _LEGACY_TIBIA_PATHS:
 			if os.path.exists(path):
 				return path
 		return os.path.join(os.getcwd(), "Tibia")
@@ -121,15 +157,18 @@ class LauncherCore:
     
 	def load_config(self):
 		"""Load configuration from file"""
+		# (config_file, payload) last read or written; lets save_config skip no-op writes
+		self._config_snapshot = None
 		if os.path.exists(self.config_file):
 			try:
-				with open(self.config_file, 'r') as f:
-					config = json.load(f)
+				with open(self.config_file, 'rb') as f:
+					config = json_loads(f.read())
 					self.last_version = config.get('last_version', '')
 					self.last_update = config.get('last_update', '')
 					custom_protected = config.get('protected_folders', [])
 					if custom_protected:
 						self.protected_folders = custom_protected
+				self._config_snapshot = (self.config_file, self._config_payload())
 			except Exception:
 				self.last_version = ''
 				self.last_update = ''
@@ -137,54 +176,165 @@ class LauncherCore:
 			self.last_version = ''
 			self.last_update = ''
 
+	def _config_payload(self):
+		"""Serialize the persisted launcher settings exactly as save_config writes them"""
+		data = {
+			'last_version': getattr(self, 'last_version', ''),
+			'last_update': getattr(self, 'last_update', ''),
+			'protected_folders': self.protected_folders,
+		}
+		return json_dumps(data, indent=True)
+
 	def save_config(self):
 		"""Persist launcher configuration to JSON file.
 
 		Stores last_version, last_update, and protected_folders. Silently
 		ignores filesystem errors (so a readonly or portable medium does not
 		crash the launcher). Returns True on success, False otherwise.
+		Skips the write when the file already holds exactly this content.
 		"""
 		try:
+			payload = self._config_payload()
+			snapshot = (self.config_file, payload)
+			if snapshot == getattr(self, '_config_snapshot', None):
+				return True
 			os.makedirs(self.tibia_dir, exist_ok=True)
+			with open(self.config_file, 'w', encoding='utf-8') as f:
+				f.write(payload)
+			self._config_snapshot = snapshot
+			return True
+		except Exception:
+			return False
+
+	def get_cache_file_path(self):
+		"""Get the path of the on-disk remote metadata cache"""
+		return os.path.join(self.tibia_dir, '.launcher_cache.json')
+
+	def _load_disk_cache(self):
+		"""Seed remote metadata caches from the previous run's cache file.
+
+		Entries younger than REMOTE_METADATA_TTL are reused without touching the
+		network; older ones still provide ETag/Last-Modified validators so the
+		first refresh is a conditional GET. Missing or corrupt files are ignored.
+		"""
+		try:
+			with open(self.get_cache_file_path(), 'rb') as f:
+				data = json_loads(f.read())
+		except (OSError, ValueError):
+			return
+		if not isinstance(data, dict):
+			return
+		self.github_downloader.set_http_validators(data.get('validators') or {})
+		# Wall-clock age -> position on the monotonic clock used by _cached_fetch
+		now_wall, now_mono = time.time(), time.monotonic()
+		for key, entry in (data.get('entries') or {}).items():
+			try:
+				value, fetched_at = entry['value'], float(entry['fetched_at'])
+			except (KeyError, TypeError, ValueError):
+				continue
+			if value is None:
+				continue
+			if key == 'latest_release':
+				self.cached_release_info = value
+			age = now_wall - fetched_at
+			if 0 <= age < self.REMOTE_METADATA_TTL:
+				self._fetch_cache[key] = (value, now_mono - age)
+
+	def _save_disk_cache(self):
+		"""Write the remote metadata caches to disk. Returns True on success."""
+		try:
+			now_wall, now_mono = time.time(), time.monotonic()
 			data = {
-				'last_version': getattr(self, 'last_version', ''),
-				'last_update': getattr(self, 'last_update', ''),
-				'protected_folders': self.protected_folders,
+				'entries': {
+					key: {'value': value, 'fetched_at': now_wall - (now_mono - fetched_at)}
+					for key, (value, fetched_at) in dict(self._fetch_cache).items()
+				},
+				'validators': self.github_downloader.get_http_validators(),
 			}
-			with open(self.config_file, 'w', encoding='utf-8') as f:
-				json.dump(data, f, indent=2)
+			payload = json_dumps(data)
+			path = self.get_cache_file_path()
+			tmp_path = path + '.tmp'
+			# Update checks run on worker threads; serialize writers of the temp file
+			with self._disk_cache_lock:
+				os.makedirs(self.tibia_dir, exist_ok=True)
+				with open(tmp_path, 'w', encoding='utf-8') as f:
+					f.write(payload)
+				os.replace(tmp_path, path)
 			return True
 		except Exception:
 			return False
 
+	def is_metadata_fresh(self):
+		"""True if remote config and release info can be served from cache without network I/O"""
+		now = time.monotonic()
+		for key in ('remote_config', 'latest_release'):
+			entry = self._fetch_cache.get(key)
+			if entry is None or now - entry[1] >= self.REMOTE_METADATA_TTL:
+				return False
+		return True
+
+	def _cached_fetch(self, key, ttl, fetcher, force_refresh: bool = False):
+		"""Return ``fetcher()``'s result, reusing it for ``ttl`` seconds.
+
+		Failed fetches (None) are not cached so the next call retries.
+		"""
+		entry = self._fetch_cache.get(key)
+		now = time.monotonic()
+		if entry is not None and not force_refresh and now - entry[1] < ttl:
+			return entry[0]
+		value = fetcher()
+		if value is not None:
+			self._fetch_cache[key] = (value, now)
+			self._save_disk_cache()
+		return value
+
 	def get_remote_config(self, force_refresh: bool = False):
 		"""Return remote configuration (cached).
 
-		Delegates to GitHubDownloader. Cache result to avoid repeated network
-		calls within a single launcher session.
+		Delegates to GitHubDownloader. The result is reused for
+		REMOTE_METADATA_TTL seconds, after which it is revalidated with a
+		conditional GET.
 		"""
-		if self.remote_config is not None and not force_refresh:
-			return self.remote_config
-		self.remote_config = self.github_downloader.get_remote_config()
+		self.remote_config = self._cached_fetch(
+			'remote_config', self.REMOTE_METADATA_TTL,
+			self.github_downloader.get_remote_config, force_refresh)
 		return self.remote_config
     
+	@property
+	def protected_folders(self):
+		return self._protected_folders
+
+	@protected_folders.setter
+	def protected_folders(self, folders):
+		self._protected_folders = folders
+		# Hashed copy for the per-entry membership tests in the clean/move loops;
+		# the list keeps its order for the config file and the UI
+		self._protected_set = frozenset(folders)
+		# Zip member names keep the archive's case and may use either separator;
+		# compare their first component against these (case-folded on Windows)
+		self._protected_keys = frozenset(os.path.normcase(f) for f in folders)
+
 	def set_protected_folders(self, folders):
 		"""Set custom protected folders"""
-		self.protected_folders = folders if folders else self.default_protected_folders.copy()
+		folders = folders if folders else self.default_protected_folders.copy()
+		# The remote config re-sends the same list on every install; only a real
+		# change needs the set rebuilt and the config re-serialized
+		if folders != self.protected_folders:
+			self.protected_folders = folders
+			self.save_config()
 		self.file_manager.protected_folders = self.protected_folders
-		self.save_config()
     
 	def add_protected_folder(self, folder_name):
 		"""Add a folder to the protected list"""
 		if folder_name and folder_name not in self.protected_folders:
-			self.protected_folders.append(folder_name)
+			self.protected_folders = self.protected_folders + [folder_name]
 			self.file_manager.protected_folders = self.protected_folders
 			self.save_config()
     
 	def remove_protected_folder(self, folder_name):
 		"""Remove a folder from the protected list"""
 		if folder_name in self.protected_folders:
-			self.protected_folders.remove(folder_name)
+			self.protected_folders = [f for f in self.protected_folders if f != folder_name]
 			self.file_manager.protected_folders = self.protected_folders
 			self.save_config()
     
@@ -212,48 +362,62 @@ class LauncherCore:
 		if hasattr(self, 'last_version') and self.last_version:
 			return self.last_version
         
-		# Try to find version file in Tibia folder first
+		# Version file in the Tibia folder, then the main directory; failing that, any
+		# Tibia.exe in either place. One stat per candidate doubles as the cache key, so an
+		# unchanged install (including a version.txt edited by hand) needs no file reads.
 		target_path = self.get_target_folder_path()
-		version_file = os.path.join(target_path, 'version.txt')
-		if os.path.exists(version_file):
-			try:
-				with open(version_file, 'r') as f:
-					return f.read().strip()
-			except Exception:
-				pass
-        
-		# Try to find version file in main directory
-		version_file = os.path.join(self.tibia_dir, 'version.txt')
-		if os.path.exists(version_file):
-			try:
-				with open(version_file, 'r') as f:
-					return f.read().strip()
-			except Exception:
-				pass
+		candidates = (
+			os.path.join(target_path, 'version.txt'),
+			os.path.join(self.tibia_dir, 'version.txt'),
+			os.path.join(target_path, 'Tibia.exe'),
+			os.path.join(self.tibia_dir, 'Tibia.exe'),
+		)
+		signatures = tuple(self._stat_signature(path) for path in candidates)
+		key = (candidates, signatures)
+		if self._version_cache is not None and self._version_cache[0] == key:
+			return self._version_cache[1]
         
-		# Check if any Tibia files exist in Tibia folder
-		tibia_exe = os.path.join(target_path, 'Tibia.exe')
-		if os.path.exists(tibia_exe):
-			return "Unknown version (installed)"
+		version = None
+		for version_file, signature in zip(candidates[:2], signatures[:2]):
+			if signature is not None:
+				try:
+					with open(version_file, 'r') as f:
+						version = f.read().strip()
+					break
+				except Exception:
+					pass
         
-		# Check if any Tibia files exist in main directory
-		tibia_exe = os.path.join(self.tibia_dir, 'Tibia.exe')
-		if os.path.exists(tibia_exe):
-			return "Unknown version (installed)"
+		if version is None and (signatures[2] is not None or signatures[3] is not None):
+			version = "Unknown version (installed)"
         
-		return None
+		self._version_cache = (key, version)
+		return version
     
-	def get_latest_release_info(self):
-		"""Get information about the latest release from GitHub"""
+	@staticmethod
+	def _stat_signature(path):
+		"""(mtime_ns, size) of path, or None if it doesn't exist"""
+		try:
+			st = os.stat(path)
+		except OSError:
+			return None
+		return st.st_mtime_ns, st.st_size
+    
+	def get_latest_release_info(self, force_refresh: bool = False):
+		"""Get information about the latest release from GitHub (TTL-cached)"""
+		return self._cached_fetch(
+			'latest_release', self.REMOTE_METADATA_TTL,
+			self._fetch_latest_release_info, force_refresh)
+
+	def _fetch_latest_release_info(self):
 		# Try config-based approach first
-		download_info = self.github_downloader.get_download_info_from_config()
+		download_info = self.github_downloader.get_download_info_from_config(self.get_remote_config())
 		if download_info:
 			rel = download_info['release']
 			# Normalize to always expose a 'version' key
 			version_val = rel.get('version') or rel.get('tag_name') or rel.get('name') or ''
 			# Strip common leading 'v'
-			if isinstance(version_val, str) and version_val.lower().startswith('v') and version_val[1:2].isdigit():
-				version_val = version_val[1:]
+			if isinstance(version_val, str):
+				version_val = _LEADING_V_RE.sub('', version_val)
 			rel['version'] = version_val
 			return rel
         
@@ -261,8 +425,8 @@ class LauncherCore:
 		rel = self.github_downloader.get_latest_release()
 		if rel:
 			version_val = rel.get('version') or rel.get('tag_name') or rel.get('name') or ''
-			if isinstance(version_val, str) and version_val.lower().startswith('v') and version_val[1:2].isdigit():
-				version_val = version_val[1:]
+			if isinstance(version_val, str):
+				version_val = _LEADING_V_RE.sub('', version_val)
 			rel['version'] = version_val
 		return rel
     
@@ -293,47 +457,11 @@ class LauncherCore:
     
 	def _compare_versions(self, version1, version2):
 		"""
-		Compare two version strings using semantic versioning logic.
+		Compare two version strings (PEP 440 ordering via parse_version).
 		Returns: -1 if version1 < version2, 0 if equal, 1 if version1 > version2
 		"""
-		def normalize_version(v):
-			"""Normalize version string by removing 'v' prefix and splitting into parts"""
-			if not v:
-				return [0]
-			# Remove 'v' prefix if present
-			v = str(v).strip().lower()
-			if v.startswith('v'):
-				v = v[1:]
-            
-			try:
-				# Split by dots and convert to integers
-				parts = []
-				for part in v.split('.'):
-					# Handle pre-release suffixes like '1.0.0-beta'
-					if '-' in part:
-						part = part.split('-')[0]
-					parts.append(int(part))
-				return parts
-			except (ValueError, AttributeError):
-				# If parsing fails, treat as [0]
-				return [0]
-        
-		v1_parts = normalize_version(version1)
-		v2_parts = normalize_version(version2)
-        
-		# Pad shorter version with zeros
-		max_length = max(len(v1_parts), len(v2_parts))
-		v1_parts.extend([0] * (max_length - len(v1_parts)))
-		v2_parts.extend([0] * (max_length - len(v2_parts)))
-        
-		# Compare part by part
-		for p1, p2 in zip(v1_parts, v2_parts):
-			if p1 < p2:
-				return -1
-			elif p1 > p2:
-				return 1
-        
-		return 0
+		# The same (installed, latest) pair comes back on every status check
+		return compare_versions(version1 or '', version2 or '')
     
 	def check_tibia_version_status(self):
 		"""
@@ -398,7 +526,7 @@ class LauncherCore:
 		"""Download and install the latest version"""
 		try:
 			# Get download info from config
-			download_info = self.github_downloader.get_download_info_from_config()
+			download_info = self.github_downloader.get_download_info_from_config(self.get_remote_config())
 			if not download_info:
 				raise Exception("Could not get download information from remote config")
             
@@ -430,97 +558,118 @@ class LauncherCore:
 			current_version = self.get_current_version()
 			is_first_install = not current_version or current_version == "Not installed"
             
-			# Create temporary directory for download
-			with tempfile.TemporaryDirectory() as temp_dir:
-				zip_path = os.path.join(temp_dir, zip_asset['name'])
-                
-				if progress_callback:
-					progress_callback(10, 100)
-                
-				# Download the zip file
+			if progress_callback:
+				progress_callback(10, 100)
+            
+			# Create temporary directory for the protected-folder backup, next to the
+			# install so restoring it is a rename rather than a cross-device copy
+			with (
+				tempfile.TemporaryDirectory(prefix='.update_', dir=self.tibia_dir) as temp_dir,
+				ThreadPoolExecutor(max_workers=1) as prep,
+			):
+				# The backup only reads protected folders, which neither the clean nor the
+				# extraction touches, so it runs while the archive downloads (only if update scenario)
+				backup_path = os.path.join(temp_dir, 'backup')
+				backup = None
+				if not is_first_install:
+					backup = prep.submit(self.backup_protected_folders_from_target, backup_path, target_path)
+
+				# Download the zip into a spooled buffer (in memory unless it's large) and extract
+				# straight from it instead of writing it out to a temp file and reading it back
 				download_url = zip_asset.get('download_url') or zip_asset.get('browser_download_url')
-				success = self.github_downloader.download_file(
-					download_url,
-					zip_path,
-					progress_callback
-				)
+				archive = self.github_downloader.download_to_spool(download_url, progress_callback)
                 
-				if not success:
+				if archive is None:
 					raise Exception("Failed to download the update")
                 
-				if progress_callback:
-					progress_callback(40, 100)
-                
-				# CLEAN: remove all non-protected items from target first
-				self.clean_target_directory(target_path)
+				with archive:
+					if progress_callback:
+						progress_callback(40, 100)
 
-				if progress_callback:
-					progress_callback(55, 100)
+					# Make sure the backup is complete before anything in the target is removed
+					if backup is not None:
+						backup.result()
 
-				# Backup protected folders AFTER cleaning for safety (only if update scenario)
-				if not is_first_install:
-					backup_path = os.path.join(temp_dir, 'backup')
-					self.backup_protected_folders_from_target(backup_path, target_path)
-
-				if progress_callback:
-					progress_callback(60, 100)
-
-				# Extract zip contents
-				with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-					for member in zip_ref.infolist():
-						# Skip protected folders entirely
-						parts = member.filename.split('/')
-						if parts and parts[0] in self.protected_folders:
-							continue
-						try:
-							zip_ref.extract(member, target_path)
-						except PermissionError:
-							# Try to rename existing then re-attempt extract
-							target_member_path = os.path.join(target_path, member.filename)
-							if os.path.exists(target_member_path):
+					if progress_callback:
+						progress_callback(55, 100)
+
+					# CLEAN: remove all non-protected items from target first
+					self.clean_target_directory(target_path)
+
+					if progress_callback:
+						progress_callback(60, 100)
+
+					# Extract zip contents, skipping anything under (or named like) a protected folder
+					with zipfile.ZipFile(archive, 'r') as zip_ref:
+						members = [m for m in zip_ref.infolist() if not self._is_protected_member(m.filename)]
+						if isinstance(archive, BufferFile):
+							# Each worker thread opens its own ZipFile on the shared, already
+							# filled buffer; nothing is copied
+							self.file_manager.extract_zip_parallel(
+								archive.getbuffer(), target_path, members,
+								extract=self._extract_member_replacing_locked)
+						else:
+							# Spilled to an anonymous temp file: one shared seek position, so extract in order
+							for member in self.file_manager.make_skeleton(target_path, members):
 								try:
-									renamed = target_member_path + f".old_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-									os.replace(target_member_path, renamed)
-									zip_ref.extract(member, target_path)
-								except Exception:
-									print(f"Warning: skipped locked file {member.filename}")
-							else:
-								print(f"Warning: permission error extracting {member.filename}")
-						except Exception as e:
-							print(f"Warning extracting {member.filename}: {e}")
-
-				if progress_callback:
-					progress_callback(80, 100)
-
-				# Restore protected folders (if update)
-				if not is_first_install:
-					self.restore_protected_folders_to_target(backup_path, target_path)
+									self._extract_member_replacing_locked(zip_ref, member, target_path)
+								except Exception as e:
+									print(f"Warning extracting {member.filename}: {e}")
+
+					if progress_callback:
+						progress_callback(80, 100)
+
+					# Restore protected folders (if update)
+					if not is_first_install:
+						self.restore_protected_folders_to_target(backup_path, target_path)
                 
-				if progress_callback:
-					progress_callback(90, 100)
+					if progress_callback:
+						progress_callback(90, 100)
                 
-				# Update version info
-				target_version = config.get('version') or config.get('release_tag') or release_info.get('tag_name', '1.0')
-				self.last_version = target_version
-				self.last_update = datetime.now().isoformat()
-				self.save_config()
+					# Update version info
+					target_version = config.get('version') or config.get('release_tag') or release_info.get('tag_name', '1.0')
+					self.last_version = target_version
+					self.last_update = datetime.now().isoformat()
+					self.save_config()
                 
-				# Create version file in target folder
-				version_file = os.path.join(target_path, 'version.txt')
-				with open(version_file, 'w') as f:
-					f.write(self.last_version)
+					# Create version file in target folder
+					version_file = os.path.join(target_path, 'version.txt')
+					with open(version_file, 'w') as f:
+						f.write(self.last_version)
                 
-				if progress_callback:
-					progress_callback(100, 100)
+					if progress_callback:
+						progress_callback(100, 100)
                 
-				return True
+					return True
                 
 		except Exception as e:
 			print(f"Installation error: {e}")
 			raise e
     
+	def _is_protected_member(self, name):
+		"""True if a zip member name's first path component is a protected folder"""
+		first = name.replace('\\', '/').split('/', 1)[0]
+		return os.path.normcase(first) in self._protected_keys
+    
+	def _extract_member_replacing_locked(self, zip_ref, member, target_path):
+		"""Extract one zip member, moving aside an existing file that is locked (e.g. in use)"""
+		try:
+			self.file_manager.extract_member(zip_ref, member, target_path)
+		except PermissionError:
+			# Try to rename existing then re-attempt extract
+			target_member_path = os.path.join(target_path, member.filename)
+			if os.path.exists(target_member_path):
+				try:
+					renamed = target_member_path + f".old_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+					os.replace(target_member_path, renamed)
+					self.file_manager.extract_member(zip_ref, member, target_path)
+				except Exception:
+					print(f"Warning: skipped locked file {member.filename}")
+			else:
+				print(f"Warning: permission error extracting {member.filename}")
+    
 	def backup_protected_folders(self, backup_dir):
-		"""Backup protected folders before extraction"""
+		"""Backup protected folders before extraction (hard-linked when on the same volume)"""
 		backup_path = os.path.join(backup_dir, 'backup')
 		os.makedirs(backup_path, exist_ok=True)
         
@@ -528,10 +677,7 @@ class LauncherCore:
 			source_path = os.path.join(self.tibia_dir, folder_name)
 			if os.path.exists(source_path):
 				dest_path = os.path.join(backup_path, folder_name)
-				if os.path.isdir(source_path):
-					shutil.copytree(source_path, dest_path)
-				else:
-					shutil.copy2(source_path, dest_path)
+				self.file_manager.clone_item(source_path, dest_path)
     
 	def restore_protected_folders(self, backup_dir):
 		"""Restore protected folders after extraction"""
@@ -554,25 +700,30 @@ class LauncherCore:
                 
 				# Restore from backup
 				if os.path.isdir(source_path):
-					shutil.copytree(source_path, dest_path)
+					self.file_manager.copy_tree_parallel(source_path, dest_path)
 				else:
 					shutil.copy2(source_path, dest_path)
     
 	def backup_protected_folders_from_target(self, backup_dir, target_path):
-		"""Backup protected folders from the target directory"""
+		"""Backup protected folders from the target directory.
+
+		Extraction replaces files rather than rewriting them in place, so the backup
+		can share file data with them: hard links on the same volume, a real copy otherwise.
+		"""
 		os.makedirs(backup_dir, exist_ok=True)
         
 		for folder_name in self.protected_folders:
 			source_path = os.path.join(target_path, folder_name)
 			if os.path.exists(source_path):
 				dest_path = os.path.join(backup_dir, folder_name)
-				if os.path.isdir(source_path):
-					shutil.copytree(source_path, dest_path)
-				else:
-					shutil.copy2(source_path, dest_path)
+				self.file_manager.clone_item(source_path, dest_path)
     
 	def restore_protected_folders_to_target(self, backup_dir, target_path):
-		"""Restore protected folders to the target directory"""
+		"""Restore protected folders to the target directory.
+
+		The backup is a throwaway copy, so items are moved back (a rename when the
+		backup and target share a filesystem) rather than copied again.
+		"""
 		if not os.path.exists(backup_dir):
 			return
         
@@ -581,18 +732,13 @@ class LauncherCore:
 			if os.path.exists(source_path):
 				dest_path = os.path.join(target_path, folder_name)
                 
-				# Remove the existing folder first if it exists
+				# Move the existing folder into the backup directory, which is inside the
+				# update's temporary directory and deleted with it
 				if os.path.exists(dest_path):
-					if os.path.isdir(dest_path):
-						shutil.rmtree(dest_path)
-					else:
-						os.remove(dest_path)
+					self.file_manager.discard_path(dest_path, trash_dir=backup_dir)
                 
 				# Restore from backup
-				if os.path.isdir(source_path):
-					shutil.copytree(source_path, dest_path)
-				else:
-					shutil.copy2(source_path, dest_path)
+				self.file_manager.move_into_place(source_path, dest_path)
 
 	def clean_target_directory(self, target_path, prune_old_backups=True):
 		"""Remove all non-protected items from target directory.
@@ -604,45 +750,56 @@ class LauncherCore:
 			return
 
 		timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
+		# One directory listing; each DirEntry carries its type (and, once asked,
+		# its stat) so there are no separate isdir/islink/getmtime calls per item
+		with os.scandir(target_path) as it:
+			entries = list(it)
+
+		# .old_ leftovers that are still around after cleaning, by original name: (path, mtime, is_dir)
 		backups = {}
-		for item in os.listdir(target_path):
-			if item in self.protected_folders:
+		for entry in entries:
+			if entry.name in self._protected_set:
 				continue
-			item_path = os.path.join(target_path, item)
+			item_path = entry.path
+			is_dir = entry.is_dir(follow_symlinks=False)
+			remaining = item_path
 			# Skip version file until after extraction (it will be overwritten later)
 			try:
-				if os.path.isdir(item_path) and not os.path.islink(item_path):
+				if is_dir:
 					shutil.rmtree(item_path, ignore_errors=False)
 				else:
 					os.remove(item_path)
+				remaining = None
 			except PermissionError:
 				try:
-					renamed = f"{item_path}.old_{timestamp}"
-					os.replace(item_path, renamed)
-					base = os.path.basename(item_path)
-					backups.setdefault(base, []).append(renamed)
+					remaining = f"{item_path}.old_{timestamp}"
+					os.replace(item_path, remaining)
 				except Exception:
+					remaining = item_path
 					print(f"Warning: could not remove or rename locked item: {item_path}")
 			except Exception as e:
 				print(f"Warning deleting {item_path}: {e}")
 
-		if prune_old_backups:
-			# Collect all .old_ siblings and keep only newest 5 for each base name
-			for entry in os.listdir(target_path):
-				if '.old_' in entry:
-					base_root = entry.split('.old_')[0]
-					backups.setdefault(base_root, []).append(os.path.join(target_path, entry))
-			for base, paths in backups.items():
-				# Sort by modified time descending
-				paths_sorted = sorted(paths, key=lambda p: os.path.getmtime(p) if os.path.exists(p) else 0, reverse=True)
-				for obsolete in paths_sorted[5:]:
-					try:
-						if os.path.isdir(obsolete):
-							shutil.rmtree(obsolete, ignore_errors=True)
-						else:
-							os.remove(obsolete)
-					except Exception:
-						pass
+			if prune_old_backups and remaining and '.old_' in os.path.basename(remaining):
+				try:
+					# A rename keeps the mtime, so the entry's stat is still accurate
+					mtime = entry.stat().st_mtime
+				except OSError:
+					mtime = 0
+				base_root = entry.name.split('.old_')[0]
+				backups.setdefault(base_root, []).append((remaining, mtime, is_dir))
+
+		# Keep only the newest 5 .old_ backups for each base name
+		for base, items in backups.items():
+			items.sort(key=lambda item: item[1], reverse=True)
+			for obsolete, _, obsolete_is_dir in items[5:]:
+				try:
+					if obsolete_is_dir:
+						shutil.rmtree(obsolete, ignore_errors=True)
+					else:
+						os.remove(obsolete)
+				except Exception:
+					pass
     
 	def extract_to_download_folder(self, zip_path, download_path):
 		"""Extract the zip file to the download folder"""
@@ -653,7 +810,7 @@ class LauncherCore:
 		"""Move files from download folder to target folder, skipping protected folders"""
 		for item_name in os.listdir(download_path):
 			# Skip protected folders
-			if item_name in self.protected_folders:
+			if item_name in self._protected_set:
 				continue
             
 			source_item = os.path.join(download_path, item_name)
@@ -680,6 +837,9 @@ class LauncherCore:
     
 	def launch_tibia(self):
 		"""Launch the Tibia client"""
+		# Only needed here and for the self-update, so kept off the startup import path
+		import subprocess
+
 		# Priority 1: Look for client.exe in Tibia/bin/ folder
 		target_path = self.get_target_folder_path()
 		client_exe = os.path.join(target_path, 'bin', 'client.exe')
@@ -722,13 +882,16 @@ class LauncherCore:
 		Order:
 		  1. Attempt JSON endpoints (fast, stable)
 		  2. Fallback to legacy /?online? HTML page scraping
-		Returns an int or None.
+		Every endpoint is requested at once; the answer is taken from the first
+		source in that order that yields a count, so a slow or dead page costs one
+		timeout instead of one per page. Returns an int or None.
 		"""
 		if force_scrape is None:
 			force_scrape = os.environ.get('PLAYERS_FORCE_SCRAPE', '0') == '1'
 		if self.debug_players and force_scrape:
 			print("[players-debug] Force scrape mode active (skip API)")
 
+		probes = []
 		if not force_scrape:
 			# 1. JSON API attempt(s)
 			override = os.environ.get('PLAYERS_API_ENDPOINTS')
@@ -739,28 +902,7 @@ class LauncherCore:
 					"https://your-tibia-server.com/api/online",
 					"https://your-tibia-server.com/api/status",
 				]
-			for api_url in api_endpoints:
-				try:
-					resp = requests.get(api_url, timeout=5)
-					if not resp.ok:
-						if self.debug_players:
-							print(f"[players-debug] API {api_url} -> HTTP {resp.status_code}")
-						continue
-					data = resp.json()
-					for key in ("online", "players_online", "players", "playersOnline"):
-						if key in data:
-							try:
-								val = int(data[key])
-								if 0 <= val <= 50000:
-									if self.debug_players:
-										print(f"[players-debug] API {api_url} key '{key}'={val}")
-									return val
-							except (TypeError, ValueError):
-								continue
-				except Exception as ex:
-					if self.debug_players:
-						print(f"[players-debug] Exception calling {api_url}: {ex}")
-					continue
+			probes.extend((self._probe_players_api, url) for url in api_endpoints)
 
 		# 2. Fallback HTML scraping (expanded list of likely pages)
 		html_pages = [
@@ -772,56 +914,93 @@ class LauncherCore:
 			"https://your-tibia-server.com/index.php",
 			"https://your-tibia-server.com/",
 		]
+		probes.extend((self._probe_players_html, page) for page in html_pages)
 
-		import re
-		patterns = [
-			r"Players? Online\D+(\d+)",
-			r"Online Players?\D+(\d+)",
-			r"(\d+)\s+players? online",
-			r"(\d+)\s+online now",
-		]
+		# Fits the session's connection pool, so no connection is opened twice
+		executor = ThreadPoolExecutor(max_workers=min(8, len(probes)))
+		try:
+			futures = [executor.submit(probe, url) for probe, url in probes]
+			# Wait in priority order: a later page's heuristic guess must not win
+			# over an API count that is still on its way
+			for future in futures:
+				val = future.result()
+				if val is not None:
+					return val
+			return None
+		finally:
+			# Return as soon as there's an answer; requests still in flight finish
+			# in the background and the queued ones never start
+			executor.shutdown(wait=False, cancel_futures=True)
 
-		for page in html_pages:
-			try:
-				resp = requests.get(page, timeout=8)
-				if not resp.ok:
-					continue
-				text = resp.text
+	def _probe_players_api(self, api_url):
+		"""Read the players-online count from one JSON endpoint, or None"""
+		try:
+			resp = self.http.get(api_url, timeout=5)
+			if not resp.ok:
 				if self.debug_players:
-					print(f"[players-debug] Scrape {page} status={resp.status_code} length={len(text)}")
-				for pat in patterns:
-					m = re.search(pat, text, re.IGNORECASE)
-					if m:
-						try:
-							val = int(m.group(1).replace(',', ''))
-							if 0 <= val <= 50000:
-								if self.debug_players:
-									print(f"[players-debug] Pattern '{pat}' matched {val} on {page}")
-								return val
-						except ValueError:
-							continue
-				# Broad heuristic fallback: capture standalone small integers near words 'player' or 'online'
-				vicinity = re.findall(r"(\d{1,5})", text)
-				if vicinity:
-					candidates = [int(v) for v in vicinity if v.isdigit() and 0 < int(v) <= 50000]
-					if candidates:
-						# pick the most frequent plausible number to reduce random noise
-						from collections import Counter
-						most_common = Counter(candidates).most_common(3)
-						if most_common:
+					print(f"[players-debug] API {api_url} -> HTTP {resp.status_code}")
+				return None
+			data = json_loads(resp.content)
+			for key in ("online", "players_online", "players", "playersOnline"):
+				if key in data:
+					try:
+						val = int(data[key])
+						if 0 <= val <= 50000:
 							if self.debug_players:
-								print(f"[players-debug] Heuristic chose {most_common[0][0]} on {page}")
-							return most_common[0][0]
-			except Exception as ex:
-				if self.debug_players:
-					print(f"[players-debug] Exception scraping {page}: {ex}")
-				continue
+								print(f"[players-debug] API {api_url} key '{key}'={val}")
+							return val
+					except (TypeError, ValueError):
+						continue
+		except Exception as ex:
+			if self.debug_players:
+				print(f"[players-debug] Exception calling {api_url}: {ex}")
 		return None
 
-	def check_launcher_update(self):
-		"""Check if there's a newer version of the launcher available"""
+	def _probe_players_html(self, page):
+		"""Scrape the players-online count from one HTML page, or None"""
 		try:
-			config = self.get_remote_config()
+			resp = self.http.get(page, timeout=8, headers={'Accept': 'text/html'})
+			if not resp.ok:
+				return None
+			text = resp.text
+			if self.debug_players:
+				print(f"[players-debug] Scrape {page} status={resp.status_code} length={len(text)}")
+			for pat in _PLAYER_COUNT_PATTERNS:
+				m = pat.search(text)
+				if m:
+					try:
+						val = int(m.group(1).replace(',', ''))
+						if 0 <= val <= 50000:
+							if self.debug_players:
+								print(f"[players-debug] Pattern '{pat.pattern}' matched {val} on {page}")
+							return val
+					except ValueError:
+						continue
+			# Broad heuristic fallback: capture standalone small integers near words 'player' or 'online'
+			vicinity = _SMALL_NUMBER_RE.findall(text)
+			if vicinity:
+				candidates = [n for n in map(int, vicinity) if 0 < n <= 50000]
+				if candidates:
+					# pick the most frequent plausible number to reduce random noise; max()
+					# keeps the first-seen value on ties, as most_common() did, without sorting
+					counts = Counter(candidates)
+					best = max(counts, key=counts.get)
+					if self.debug_players:
+						print(f"[players-debug] Heuristic chose {best} on {page}")
+					return best
+		except Exception as ex:
+			if self.debug_players:
+				print(f"[players-debug] Exception scraping {page}: {ex}")
+		return None
+
+	def check_launcher_update(self, config=None):
+		"""Check if there's a newer version of the launcher available
+
+		``config`` lets callers reuse a remote config they already fetched.
+		"""
+		try:
+			if config is None:
+				config = self.get_remote_config()
 			if not config:
 				return None
                 
@@ -832,21 +1011,22 @@ class LauncherCore:
 				launcher_repo = config.get('launcher_github_repository', 'tibialauncher')
                 
 				if launcher_username and launcher_repo:
-					# Get latest release from launcher repository
-					api_url = f"https://api.github.com/repos/{launcher_username}/{launcher_repo}/releases/latest"
-					response = requests.get(api_url, timeout=10)
+					# Get latest release from launcher repository; repeat checks are answered
+					# with a bodiless 304 while the release is unchanged
+					release_data = self.github_downloader.get_latest_release(launcher_username, launcher_repo)
                     
-					if response.ok:
-						release_data = response.json()
+					if release_data:
 						latest_version = release_data.get('tag_name', '').lstrip('v')
+						current_version = self.get_current_launcher_version()
                         
 						# Simple version comparison (assumes semantic versioning)
-						if self._is_newer_version(latest_version, self.get_current_launcher_version()):
+						if self._is_newer_version(latest_version, current_version):
 							return {
 								'available': True,
 								'latest_version': latest_version,
-								'current_version': self.get_current_launcher_version(),
+								'current_version': current_version,
 								'download_url': self._get_launcher_download_url(release_data),
+								'sha256': self._get_launcher_sha256(release_data, config),
 								'changelog': release_data.get('body', ''),
 								'release_name': release_data.get('name', f'Version {latest_version}')
 							}
@@ -858,65 +1038,138 @@ class LauncherCore:
     
 	def get_current_launcher_version(self):
 		"""Get the current launcher version"""
-		# This should match the version in your launcher
-		return "2.0.0"  # Update this when you release new versions
+		return self.LAUNCHER_VERSION
     
 	def _is_newer_version(self, latest, current):
-		"""Simple version comparison for semantic versioning (X.Y.Z)"""
-		try:
-			latest_parts = [int(x) for x in latest.split('.')]
-			current_parts = [int(x) for x in current.split('.')]
-            
-			# Pad with zeros if different lengths
-			max_len = max(len(latest_parts), len(current_parts))
-			latest_parts += [0] * (max_len - len(latest_parts))
-			current_parts += [0] * (max_len - len(current_parts))
-            
-			return latest_parts > current_parts
-		except (ValueError, AttributeError):
-			return False
+		"""Version comparison for launcher releases (PEP 440, handles pre-releases)"""
+		# Periodic checks ask about the same (latest, running) pair until a release ships
+		return is_newer_release(latest, current)
     
+	def _get_launcher_asset(self, release_data):
+		"""Pick the launcher asset from a GitHub release"""
+		# The URL and the checksum both come from this asset; resolve it once per release
+		release_id = release_data.get('id')
+		cached = self._launcher_asset
+		if release_id is not None and cached is not None and cached[0] == release_id:
+			return cached[1]
+
+		assets = release_data.get('assets', [])
+		# Look for the launcher EXE ('launcher.exe' / 'tibialauncher.exe' both contain '.exe'),
+		# falling back to the first asset if no .exe found
+		asset = next((a for a in assets if '.exe' in a.get('name', '').lower()), assets[0] if assets else None)
+		if release_id is not None:
+			self._launcher_asset = (release_id, asset)
+		return asset
+
 	def _get_launcher_download_url(self, release_data):
 		"""Extract the launcher download URL from GitHub release"""
-		assets = release_data.get('assets', [])
-        
-		# Look for common launcher file patterns
-		for asset in assets:
-			name = asset.get('name', '').lower()
-			if any(pattern in name for pattern in ['launcher.exe', 'tibialauncher.exe', '.exe']):
-				return asset.get('browser_download_url')
-        
-		# Fallback to the first asset if no .exe found
-		if assets:
-			return assets[0].get('browser_download_url')
-        
-		return None
+		asset = self._get_launcher_asset(release_data)
+		return asset.get('browser_download_url') if asset else None
+
+	def _get_launcher_sha256(self, release_data, config=None):
+		"""Expected SHA-256 of the launcher EXE, if published.
+
+		Uses the remote config's 'launcher_sha256' when set, otherwise the
+		'digest' GitHub reports for the release asset ("sha256:<hex>").
+		"""
+		value = (config or {}).get('launcher_sha256')
+		if not value:
+			asset = self._get_launcher_asset(release_data) or {}
+			digest = asset.get('digest') or ''
+			if digest.startswith('sha256:'):
+				value = digest[len('sha256:'):]
+		return value.strip().lower() if isinstance(value, str) and value.strip() else None
     
-	def download_launcher_update(self, download_url, progress_callback=None):
-		"""Download the launcher update"""
+	def download_launcher_update(self, download_url, progress_callback=None, sha256=None):
+		"""Download the launcher update
+
+		With ``sha256`` the file goes to a stable per-hash temp path, so a copy
+		left by an earlier (e.g. interrupted-apply) attempt that still matches is
+		reused instead of downloaded again, and a corrupt download is rejected.
+		The download itself goes to a matching ``.part`` file, so a transfer that
+		broke off resumes with a Range request instead of starting over.
+		"""
 		try:
-			response = requests.get(download_url, stream=True)
-			response.raise_for_status()
-            
-			# Get file size for progress
-			total_size = int(response.headers.get('content-length', 0))
-            
-			# Create temporary file
-			with tempfile.NamedTemporaryFile(delete=False, suffix='.exe') as temp_file:
-				downloaded = 0
-				chunk_size = 8192
+			cached_path = part_path = None
+			if sha256:
+				cached_path = os.path.join(tempfile.gettempdir(), f"tibialauncher-update-{sha256[:16]}.exe")
+				if self.file_manager.file_sha256(cached_path) == sha256:
+					if progress_callback:
+						progress_callback(100.0)
+					return cached_path
+				part_path = cached_path + '.part'
+
+			headers = {**self.github_downloader.BINARY_HEADERS, 'Accept': 'application/octet-stream'}
+			existing = 0
+			if part_path:
+				try:
+					existing = os.path.getsize(part_path)
+				except OSError:
+					existing = 0
+				if existing:
+					headers['Range'] = f'bytes={existing}-'
+
+			# The with block hands the pooled connection back even if a write fails
+			with self.http.get(download_url, stream=True, timeout=(5, 30), headers=headers) as response:
+				if response.status_code == 416 and part_path:
+					# The part is no shorter than the file yet never verified: drop it and
+					# download from zero (no Range header this time, so this retries once)
+					response.close()
+					os.remove(part_path)
+					return self.download_launcher_update(download_url, progress_callback, sha256)
+				response.raise_for_status()
+				# 206: the server continues from the part; 200: it ignored the Range header
+				resumed = existing > 0 and response.status_code == 206
                 
-				for chunk in response.iter_content(chunk_size=chunk_size):
-					if chunk:
-						temp_file.write(chunk)
-						downloaded += len(chunk)
-                        
-						# Report progress
-						if progress_callback and total_size > 0:
-							progress = (downloaded / total_size) * 100
-							progress_callback(progress)
+				# Get file size for progress
+				total_size = int(response.headers.get('content-length', 0))
+				if resumed and total_size:
+					total_size += existing
                 
-				return temp_file.name
+				# Create temporary file
+				if part_path:
+					temp_file = open(part_path, 'ab' if resumed else 'wb')
+				else:
+					temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.exe')
+				with temp_file:
+					# Hashed in the same pass as the write; only a resumed part is read back
+					digest = hashlib.sha256() if sha256 else None
+					if resumed:
+						with open(part_path, 'rb') as f:
+							for block in iter(lambda: f.read(1 << 20), b''):
+								digest.update(block)
+					chunk_size = 1 << 20  # 1 MiB: few syscalls / interpreter round-trips per file
+					chunks = response.iter_content(chunk_size=chunk_size)
+                    
+					# Pick the loop once: without a callback (or a known size) each chunk is
+					# just written, with no per-chunk progress bookkeeping
+					if progress_callback and total_size > 0:
+						downloaded = existing if resumed else 0
+						last_pct = -1
+						for chunk in chunks:
+							temp_file.write(chunk)
+							if digest is not None:
+								digest.update(chunk)
+							downloaded += len(chunk)
+                            
+							# Report progress only when the whole-percent value changes
+							pct = downloaded * 100 // total_size
+							if pct != last_pct:
+								last_pct = pct
+								progress_callback(downloaded * 100 / total_size)
+					else:
+						for chunk in chunks:
+							temp_file.write(chunk)
+							if digest is not None:
+								digest.update(chunk)
+            
+			if sha256:
+				if not hmac.compare_digest(digest.hexdigest(), sha256.lower()):
+					os.remove(temp_file.name)
+					raise Exception("SHA-256 mismatch for downloaded launcher")
+				os.replace(temp_file.name, cached_path)
+				return cached_path
+			return temp_file.name
                 
 		except Exception as e:
 			print(f"Error downloading launcher update: {e}")
@@ -924,8 +1177,9 @@ class LauncherCore:
     
 	def apply_launcher_update(self, update_file_path):
 		"""Apply the launcher update by replacing the current executable"""
+		import subprocess
+
 		try:
-			import sys
 			current_exe = sys.executable
             
 			# If running from Python, try to find the actual launcher executable
@@ -941,20 +1195,26 @@ class LauncherCore:
 			if not os.path.exists(current_exe) or 'python' in current_exe.lower():
 				raise Exception("Could not find launcher executable to update")
             
-			# Create batch file to handle the update
+			# Create batch file to handle the update. move (not copy + del) renames the
+			# downloaded EXE into place when %TEMP% and the launcher share a volume;
+			# across volumes it copies and removes the source as before
+			# Paths are double-quoted (so & ( ) and spaces stay literal) and % is doubled,
+			# since cmd expands %...% even inside quotes
+			update_arg = '"{}"'.format(update_file_path.replace('%', '%%'))
+			exe_arg = '"{}"'.format(current_exe.replace('%', '%%'))
 			batch_content = f'''@echo off
 echo Updating Tibia Launcher...
 timeout /t 2 /nobreak >nul
-copy /y "{update_file_path}" "{current_exe}"
+move /y {update_arg} {exe_arg} >nul
 if %errorlevel% equ 0 (
 	echo Update completed successfully!
 	echo Starting updated launcher...
-	start "" "{current_exe}"
+	start "" {exe_arg}
 ) else (
 	echo Update failed!
+	del {update_arg}
 	pause
 )
-del "{update_file_path}"
 del "%~f0"
 '''
             
@@ -0,0 +1,57 @@
+"""
+Version Module (packaged)
+
+Version parsing and comparison for game and launcher releases. Kept free of
+launcher state so it can be imported (or compiled) on its own.
+"""
+
+import re
+import functools
+from packaging.version import Version, InvalidVersion
+
+
+# Numeric release part of a tag that isn't PEP 440 ("v2.1.0-win10wsl" -> "2.1.0")
+_RELEASE_PREFIX_RE = re.compile(r'^[vV]?(\d+(?:\.\d+)*)')
+
+
+def _release(v) -> Version | None:
+    """Parse a version string (optionally 'v'-prefixed) into a Version, or None without one.
+
+    Tags that aren't PEP 440 (build suffixes like "-win10wsl") fall back to their
+    leading numeric release instead of being ignored.
+    """
+    if not isinstance(v, str):
+        return None
+    v = v.strip()
+    try:
+        return Version(v)
+    except InvalidVersion:
+        m = _RELEASE_PREFIX_RE.match(v)
+        return Version(m.group(1)) if m else None
+
+
+@functools.lru_cache(maxsize=64)
+def parse_version(v) -> Version:
+    """Parse a version string into a comparable Version (see _release).
+
+    Pre-releases order correctly ('1.2.3-rc1' < '1.2.3'); anything with no
+    version in it sorts as 0.
+    """
+    return _release(v) or Version("0")
+
+
+@functools.lru_cache(maxsize=64)
+def compare_versions(v1: str, v2: str) -> int:
+    """-1, 0 or 1 as v1 sorts before, equal to or after v2 (see parse_version)"""
+    if v1 == v2:
+        return 0  # steady state: identical strings, skip parsing
+    a, b = parse_version(v1), parse_version(v2)
+    return (a > b) - (a < b)
+
+
+@functools.lru_cache(maxsize=64)
+def is_newer_release(latest: str, current: str) -> bool:
+    """True if release tag ``latest`` sorts after ``current``; False if either has no version"""
+    latest_v = _release(latest)
+    current_v = _release(current)
+    return latest_v is not None and current_v is not None and latest_v > current_v
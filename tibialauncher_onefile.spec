@@ -32,7 +32,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
   datas=datas,
-  hiddenimports=hidden_imports + ['tibialauncher', 'tibialauncher.core', 'tibialauncher.core.launcher_core', 'tibialauncher.core.github_downloader', 'tibialauncher.core.file_manager'],
+  hiddenimports=hidden_imports + ['tibialauncher', 'tibialauncher.core', 'tibialauncher.core.launcher_core', 'tibialauncher.core.github_downloader', 'tibialauncher.core.file_manager', 'tibialauncher.core.version'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],